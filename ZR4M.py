@@ -2,14 +2,25 @@
 Containes the definitions used in the ZR4M UI
 """
 
+import collections
 import itertools
 import math
-from typing import Dict, List, Optional, Set, Tuple, Union, overload
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, overload
 
 import maya.api.OpenMaya as om2
 import maya.cmds as cmds
 import maya.mel as mel
 
+# match a component range like "pCube1.vtx[10:20]" -> ("pCube1.vtx", "10", "20")
+REGEX_COMPONENT_RANGE = re.compile(r"(.+)\[(\d+):(\d+)\]")
+
+# posed geometry name -> (topology and uv of the mesh, coordinates of its master uv points).
+# Used by dict_cord_master_uv_points_from_posed_mesh() to skip the analysis of an unchanged mesh.
+# Only the last CACHE_MASTER_UV_POINT_MAXSIZE meshes used are kept.
+DICT_CACHE_MASTER_UV_POINT = collections.OrderedDict()
+CACHE_MASTER_UV_POINT_MAXSIZE = 32
+
 
 def duplicate_mesh_without_set(
     geometry_to_duplicate: Union[str, List[str], Set[str]],
@@ -32,16 +43,22 @@ def duplicate_mesh_without_set(
         output_node = cmds.duplicate(geometry_to_duplicate)
 
     for node in output_node:
-        list_all_quick_set = (set(cmds.listSets(object=node, extendToShape=1))
+        # listSets returns None when the node is not in any set
+        list_all_quick_set = (set(cmds.listSets(object=node, extendToShape=1) or [])
                               - set(cmds.listSets(
-                                    object=node, extendToShape=1, type=1)))
+                                    object=node, extendToShape=1, type=1) or []))
+        if not list_all_quick_set:
+            continue
+        list_component_to_remove = [
+            node,
+            f"{node}.vtx[*]",
+            f"{node}.e[*]",
+            f"{node}.f[*]",
+            f"{node}.vtxFace[*]",
+            f"{node}.map[*]",
+        ]
         for quick_set in list_all_quick_set:
-            cmds.sets(f"{node}", rm=quick_set)
-            cmds.sets(f"{node}.vtx[*]", rm=quick_set)
-            cmds.sets(f"{node}.e[*]", rm=quick_set)
-            cmds.sets(f"{node}.f[*]", rm=quick_set)
-            cmds.sets(f"{node}.vtxFace[*]", rm=quick_set)
-            cmds.sets(f"{node}.map[*]", rm=quick_set)
+            cmds.sets(*list_component_to_remove, rm=quick_set)
 
     return output_node
 
@@ -52,16 +69,41 @@ def return_curve_in_scene() -> Tuple[List[str], List[str]]:
     Returns:
         Tuple[List[str],List[str]]: the transform nodes list, the shapes nodes list.
     """
-    list_curve_shape_in_scene = cmds.ls(type="nurbsCurve")
+    # walk the curve shapes with the API so the parent transform comes from the dag path
+    # instead of one listRelatives call per curve. partialPathName returns the same
+    # shortest unique name as cmds.ls, so the names still match the ones in the selection.
+    list_curve_shape_in_scene = []
     list_curve_in_scene = []
-    for curve in list_curve_shape_in_scene:
-        name_curve = cmds.listRelatives(
-            curve, path=True, parent=True).pop()
-        list_curve_in_scene.append(name_curve)
+    iterator_curve = om2.MItDependencyNodes(om2.MFn.kNurbsCurve)
+    while not iterator_curve.isDone():
+        dag_path_curve = om2.MDagPath.getAPathTo(iterator_curve.thisNode())
+        list_curve_shape_in_scene.append(dag_path_curve.partialPathName())
+        list_curve_in_scene.append(dag_path_curve.pop().partialPathName())
+        iterator_curve.next()
 
     return list_curve_in_scene, list_curve_shape_in_scene
 
 
+def return_perimeter_curve_in_scene() -> Set[str]:
+    """Return all the perimeter curves, the curves connected to both a pointer and a label curve.
+
+    Returns:
+        Set[str]: the transform nodes of the perimeter curves.
+    """
+    # check the attributes on the API node of every curve instead of two attributeQuery each
+    list_perimeter_curve = set()
+    iterator_curve = om2.MItDependencyNodes(om2.MFn.kNurbsCurve)
+    while not iterator_curve.isDone():
+        dag_path_curve = om2.MDagPath.getAPathTo(iterator_curve.thisNode()).pop()
+        mfn_node_curve = om2.MFnDependencyNode(dag_path_curve.node())
+        if mfn_node_curve.hasAttribute("connection_between_perimeter_and_pointer_curve") and \
+                mfn_node_curve.hasAttribute("connection_between_label_and_perimeter_curve"):
+            list_perimeter_curve.add(dag_path_curve.partialPathName())
+        iterator_curve.next()
+
+    return list_perimeter_curve
+
+
 @overload
 def get_index_component(input_component: str) -> int:
     pass
@@ -91,17 +133,22 @@ def get_index_component(
     """
 
     if isinstance(list_component, str):
-        list_component = {list_component}
+        index_part = list_component[list_component.index("[") + 1:-1]
+        if ":" in index_part or "*" in index_part:
+            raise TypeError(
+                f"The input selection appears to not have been flattened. Found: {list_component}"
+            )
+        return int(index_part)
 
-    result = set()
-    for component in list_component:
-        index_part = component.split("[")[1]
-        if any(index_component in index_part for index_component in (":", "*")):
+    # the index is whatever is between the last "[" and the closing "]"
+    list_index_part = [component.rpartition("[")[2][:-1] for component in list_component]
+    for component, index_part in zip(list_component, list_index_part):
+        if ":" in index_part or "*" in index_part:
             raise TypeError(
                 f"The input selection appears to not have been flattened. Found: {component}"
             )
 
-        result.add(int(index_part[:-1]))
+    result = set(map(int, list_index_part))
 
     if len(result) == 1:
         return result.pop()
@@ -143,18 +190,65 @@ def add_full_name_to_index_component(
     Returns:
         Union[str, Set[str]]: The component name as str or as a set in multiple input were given.
     """
+    prefix_component = f"{geometry_name}.{mode}["
     if isinstance(input_index_component, int):
-        return f"{geometry_name}.{mode}[{int(input_index_component)}]"
+        return f"{prefix_component}{int(input_index_component)}]"
 
-    result = set()
-    for component in input_index_component:
-        result.add(f"{geometry_name}.{mode}[{int(component)}]")
-    return result
+    return {f"{prefix_component}{int(component)}]" for component in input_index_component}
+
+
+def get_mfn_mesh(geometry_name: Union[str, om2.MFnMesh]) -> om2.MFnMesh:
+    """Return the om2.MFnMesh of the given geometry. If a om2.MFnMesh is given it is reused.
+
+    Args:
+        geometry_name (str) or (om2.MFnMesh): the name of the geometry or its om2.MFnMesh.
+
+    Raises:
+        TypeError: The geometry_name variable must be either a string or a om2.MFnMesh
+
+    Returns:
+        om2.MFnMesh: the function set attached to the geometry.
+    """
+
+    if isinstance(geometry_name, om2.MFnMesh):
+        return geometry_name
+
+    if isinstance(geometry_name, str):
+        selection_list = om2.MSelectionList()
+        selection_list.add(geometry_name)
+        return om2.MFnMesh(selection_list.getDagPath(0))
+
+    raise TypeError(
+        "The geometry_name variable must be either a string or a om2.MFnMesh"
+    )
+
+
+def get_mfn_nurbs_curves(list_curve: Iterable[str]) -> Dict[str, om2.MFnNurbsCurve]:
+    """Return the om2.MFnNurbsCurve of every given curve, resolved with a single MSelectionList.
+
+    Args:
+        list_curve (Iterable[str]): the name of the curves.
+
+    Returns:
+        Dict[str, om2.MFnNurbsCurve]: the key is the name of the curve. The value is
+        the function set attached to it.
+    """
+
+    list_curve = list(list_curve)
+    selection_list = om2.MSelectionList()
+    for curve in list_curve:
+        selection_list.add(curve)
+
+    return {
+        curve: om2.MFnNurbsCurve(selection_list.getDagPath(index))
+        for index, curve in enumerate(list_curve)
+    }
 
 
 def get_closest_vertex(
     geometry_name: Union[str, om2.MFnMesh],
     input_position: Tuple[int, int, int] = (0, 0, 0),
+    list_cord_vtx: Optional[om2.MPointArray] = None,
 ) -> Tuple[int, float]:
     """Return the closest vertex and distance from mesh to world space input_position [x, y, z]
     Uses om2.MfnMesh.getClosestPoint() returned face ID and iterates through face's vertices
@@ -164,6 +258,8 @@ def get_closest_vertex(
         Its avoid to create a new one
         input_position (tuple, optional): Inside you can put the a 3D input_position in world space.
         Defaults to (0,0,0).
+        list_cord_vtx (om2.MPointArray, optional): the world space position of every vertex of the
+        mesh. Pass it when querying the same mesh many times. Defaults to None.
 
     Raises:
         TypeError: The geometry_name variable must be either a string or a om2.MFnMesh
@@ -173,18 +269,7 @@ def get_closest_vertex(
         The second one is the distance from the given input_position
     """
 
-    if isinstance(geometry_name, str):
-        selection_list = om2.MSelectionList()
-        selection_list.add(geometry_name)
-        mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
-
-    elif isinstance(geometry_name, om2.MFnMesh):
-        mfn_mesh = geometry_name
-
-    else:
-        raise TypeError(
-            "The geometry_name variable must be either a string or a om2.MFnMesh"
-        )
+    mfn_mesh = get_mfn_mesh(geometry_name)
 
     input_position = om2.MPoint(input_position)
     index_closest_face = mfn_mesh.getClosestPoint(
@@ -192,23 +277,140 @@ def get_closest_vertex(
     )[1]
     list_index_vtx_in_face = mfn_mesh.getPolygonVertices(index_closest_face)
 
-    vertex_distances = set()
-    for vtx in list_index_vtx_in_face:
-        point = mfn_mesh.getPoint(vtx, om2.MSpace.kWorld)
-        distance = point.distanceTo(input_position)
-        vertex_distances.add((vtx, distance))
-
     closest_distance = float("inf")
     closest_vtx_index = -1
-    for pair in vertex_distances:
-        distance = pair[1]
+    for vtx in list_index_vtx_in_face:
+        if list_cord_vtx is None:
+            point = mfn_mesh.getPoint(vtx, om2.MSpace.kWorld)
+        else:
+            point = list_cord_vtx[vtx]
+        distance = input_position.distanceTo(point)
         if distance < closest_distance:
-            closest_vtx_index = pair[0]
+            closest_vtx_index = vtx
             closest_distance = distance
 
     return closest_vtx_index, closest_distance
 
 
+def get_closest_vertices(
+    geometry_name: Union[str, om2.MFnMesh],
+    list_input_position: List[Tuple[float, float, float]],
+    list_cord_vtx: Optional[om2.MPointArray] = None,
+) -> List[Tuple[int, float]]:
+    """Return the closest vertex and distance for every given world space position.
+    The mesh is resolved only once for the whole batch.
+
+    Args:
+        geometry_name(str) or (om2.MFnMesh): whenever you can is preferable to pass the om2.MFnMesh.
+        list_input_position (List[Tuple[float, float, float]]): the world space positions to query.
+        list_cord_vtx (om2.MPointArray, optional): the world space position of every vertex of the
+        mesh. Pass it for big batches so the points are read only once. Defaults to None.
+
+    Raises:
+        TypeError: The geometry_name variable must be either a string or a om2.MFnMesh
+
+    Returns:
+        List[Tuple[int, float]]: for every position, in the same order, the index of the closest
+        vertex and its distance from the position.
+    """
+
+    mfn_mesh = get_mfn_mesh(geometry_name)
+
+    return [
+        get_closest_vertex(mfn_mesh, input_position, list_cord_vtx)
+        for input_position in list_input_position
+    ]
+
+
+def get_distance_to_bounding_box(
+    input_position: Tuple[float, float, float],
+    bounding_box_min: Tuple[float, float, float],
+    bounding_box_max: Tuple[float, float, float],
+) -> float:
+    """Return the distance from a position to a bounding box, 0 if the position is inside it.
+    Nothing inside the bounding box can be closer to the position than this distance.
+
+    Args:
+        input_position (Tuple[float, float, float]): the position to measure from.
+        bounding_box_min (Tuple[float, float, float]): the lowest corner of the bounding box.
+        bounding_box_max (Tuple[float, float, float]): the highest corner of the bounding box.
+
+    Returns:
+        float: the distance from the position to the closest point of the bounding box.
+    """
+
+    return math.sqrt(sum(
+        max(bounding_box_min[axis] - input_position[axis], 0.0,
+            input_position[axis] - bounding_box_max[axis]) ** 2
+        for axis in range(3)
+    ))
+
+
+def get_curve_world_bounding_box(
+    dict_mfn_curve: Dict[str, om2.MFnNurbsCurve]
+) -> List[Tuple[str, om2.MFnNurbsCurve, List[float], List[float]]]:
+    """Return the world space bounding box of every given curve, ready for get_closest_curve().
+
+    Args:
+        dict_mfn_curve (Dict[str, om2.MFnNurbsCurve]): the output of get_mfn_nurbs_curves().
+
+    Returns:
+        List[Tuple[str, om2.MFnNurbsCurve, List[float], List[float]]]: for every curve its name,
+        its function set and the lowest and highest corner of its world bounding box.
+    """
+
+    list_curve_bounding_box = []
+    for curve, mfn_curve in dict_mfn_curve.items():
+        bounding_box = cmds.exactWorldBoundingBox(curve)
+        list_curve_bounding_box.append(
+            (curve, mfn_curve, bounding_box[:3], bounding_box[3:]))
+
+    return list_curve_bounding_box
+
+
+def get_closest_curve(
+    list_input_position: List[om2.MPoint],
+    list_curve_bounding_box: List[Tuple[str, om2.MFnNurbsCurve, List[float], List[float]]],
+) -> Optional[str]:
+    """Return the curve with the lowest average distance from the given world positions.
+
+    Args:
+        list_input_position (List[om2.MPoint]): the world positions to measure from.
+        list_curve_bounding_box (List[Tuple[str, om2.MFnNurbsCurve, List[float], List[float]]]):
+        the output of get_curve_world_bounding_box() with the curves to compare.
+
+    Returns:
+        Optional[str]: the name of the closest curve. None if no curve was given.
+    """
+
+    # a curve is never closer than its bounding box. Measure the curves starting from
+    # the closest boxes and stop once they are farther than the closest curve found.
+    list_curve_lower_bound = []
+    for curve, mfn_curve, bounding_box_min, bounding_box_max in list_curve_bounding_box:
+        lower_bound = sum(
+            get_distance_to_bounding_box(input_position, bounding_box_min, bounding_box_max)
+            for input_position in list_input_position
+        )
+        list_curve_lower_bound.append((lower_bound, curve, mfn_curve))
+    list_curve_lower_bound.sort(key=lambda item: item[0])
+
+    closest_curve = None
+    closest_distance = float("inf")
+    for lower_bound, curve, mfn_curve in list_curve_lower_bound:
+        if lower_bound >= closest_distance:
+            break
+        # the number of positions is the same for every curve, compare the sums
+        distance = sum(
+            mfn_curve.distanceToPoint(input_position, space=om2.MSpace.kWorld)
+            for input_position in list_input_position
+        )
+        if distance < closest_distance:
+            closest_curve = curve
+            closest_distance = distance
+
+    return closest_curve
+
+
 def message(text: str, raise_error: bool, stay_time: int = 3000) -> None:
     """Display a message to the user.
 
@@ -234,8 +436,9 @@ def raise_error_if_mesh_has_overlapping_uvs(geometry_name: str) -> None:
     Args:
         geometry_name (str): the name of the geometry to check
     """
-    if find_overlapping_uvs(geometry_name, output_bool=True) is True:
-        cmds.select(find_overlapping_uvs(geometry_name, output_bool=False))
+    list_uv_overlapping = find_overlapping_uvs(geometry_name, output_bool=False)
+    if list_uv_overlapping:
+        cmds.select(list(list_uv_overlapping))
         # the overlapping UV are a problem because later the "unwrap" function will later merge
         # all the vtx and UV with a threshold of 0.
         message(
@@ -250,9 +453,8 @@ def raise_error_if_mesh_has_missing_uvs(geometry_name: str) -> None:
         geometry_name (str): the name of the geometry to check
     """
     # BUG: not important if uv is < than vtx. Use api to check if every vtx as at least 1 UV
-    if cmds.polyEvaluate(geometry_name, uv=True) < cmds.polyEvaluate(
-        geometry_name, vertex=True
-    ):
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    if mfn_mesh.numUVs() < mfn_mesh.numVertices:
         message(
             f"Some part of the mesh: {geometry_name} appears to be without UV",
             raise_error=True)
@@ -279,14 +481,13 @@ def raise_error_if_mesh_has_unpairable_uv_border(geometry_name: str) -> None:
     Args:
         geometry_name (str): the name of the geometry to check
     """
-    if cmds.polyEvaluate(geometry_name, uv=True) == cmds.polyEvaluate(
-        geometry_name, vertex=True
-    ):
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    if mfn_mesh.numUVs() == mfn_mesh.numVertices:
         cmds.polyMergeVertex(
             geometry_name, constructionHistory=False, distance=0.0)
-        if cmds.polyEvaluate(geometry_name, uv=True) == cmds.polyEvaluate(
-            geometry_name, vertex=True
-        ):
+        # resolve the mesh again so the counts are read after the merge
+        mfn_mesh = get_mfn_mesh(geometry_name)
+        if mfn_mesh.numUVs() == mfn_mesh.numVertices:
             # the mesh has been flatten. The goal here is to calculate the "Master UV points"
             # so the UV islands need to connected in 3D space.
             cmds.select(geometry_name)
@@ -303,18 +504,15 @@ def raise_error_if_mesh_is_unflat(geometry_name: str) -> None:
     """
 
     bbox = cmds.exactWorldBoundingBox(geometry_name, calculateExactly=True)
-    size_x = abs(abs(bbox[3])-abs(bbox[0]))
-    size_y = abs(abs(bbox[4])-abs(bbox[1]))
-    size_z = abs(abs(bbox[5])-abs(bbox[2]))
+    # the size is max - min. Comparing the absolute values would report a mesh that sits
+    # across the origin (Es: x from -1 to 1) as flat.
+    size_x, size_y, size_z = (bbox[3] - bbox[0], bbox[4] - bbox[1], bbox[5] - bbox[2])
 
     threshold_absolute_size = 0.01
-    list_flatten_axises = []
-    if size_x < threshold_absolute_size:
-        list_flatten_axises.append("x")
-    if size_y < threshold_absolute_size:
-        list_flatten_axises.append("y")
-    if size_z < threshold_absolute_size:
-        list_flatten_axises.append("z")
+    list_flatten_axises = [
+        axis for axis, size in zip("xyz", (size_x, size_y, size_z))
+        if size < threshold_absolute_size
+    ]
 
     if len(list_flatten_axises) == 0:
         message(
@@ -344,12 +542,19 @@ def get_current_selected_mesh(
     list_mesh_selected = []
     list_all_selected_objects = cmds.ls(selection=True, flatten=True)
 
-    for obj in list_all_selected_objects:
-        shape_node = cmds.listRelatives(obj, shapes=True, path=True)
-        if shape_node is not None:
-            # if the current obj selected has a shape node and its type is "mesh" then obj is a mesh
-            if cmds.objectType(shape_node[0], isType="mesh"):
-                list_mesh_selected.append(obj)
+    # NOTE: the lists are checked before every call. With an empty list cmds.ls would return
+    # every mesh in the scene and cmds.listRelatives would work on the current selection.
+    if list_all_selected_objects:
+        list_shape_node = cmds.listRelatives(
+            list_all_selected_objects, shapes=True, path=True) or []
+        list_shape_mesh = cmds.ls(list_shape_node, type="mesh") if list_shape_node else []
+        if list_shape_mesh:
+            # if the obj selected has a shape node of type "mesh" then obj is a mesh.
+            # cmds.ls gives back the parents with the same naming used by the selection
+            list_obj_mesh = set(cmds.ls(cmds.listRelatives(
+                list_shape_mesh, parent=True, path=True)))
+            list_mesh_selected = [
+                obj for obj in list_all_selected_objects if obj in list_obj_mesh]
 
     if complain_if_none_selected is True:
         if len(list_all_selected_objects) == 0:
@@ -392,24 +597,16 @@ def flatten_selection_list(
 
     flat_list = set()
     for component in selection_list:
-        name_component,  index_part = component.split("[")
-        if not any(index_component in index_part for index_component in (":", "*")):
-            flat_list.add(component)
-            continue
-        elif "*" in index_part:
+        if "*" in component:
             raise TypeError(
                 f"The '*' expression is not supported. {component}")
-            # component_type = name_component[ name_component.rfind(".") + 1 :]
-        elif ":" in index_part:
-            index_start = component.find("[") + 1
-            index_end = component.rfind(":")
-
-            begin = int(component[index_start:index_end])
-            end = int(
-                component[index_end + 1: component.find("]", index_start)])
-
-            for number in range(begin, end + 1):
-                flat_list.add(f"{name_component}[{number}]")
+        match_range = REGEX_COMPONENT_RANGE.fullmatch(component)
+        if match_range is None:
+            flat_list.add(component)
+            continue
+        name_component, begin, end = match_range.groups()
+        flat_list.update(
+            f"{name_component}[{number}]" for number in range(int(begin), int(end) + 1))
 
     return flat_list
 
@@ -424,46 +621,36 @@ def find_overlapping_uvs(
         geometry_name (str) or (om2.MFnMesh): The name of the geometry to check for overlapping UVs.
         output_bool (bool): If True returns a boolean indicating whether overlapping UVs were found.
         If False, returns a list of strings representing the UV points that overlap.
-        If no overlapping UVs are found returns None.
+        If no overlapping UVs are found returns an empty set.
 
     Returns:
         Union[bool, List[str]: If output_bool True returns if the given geometry has overlapping UV.
         If output_bool is False, returns a list of strings representing the UV points that overlap.
     """
 
-    if isinstance(geometry_name, str):
-        selection_list = om2.MSelectionList()
-        selection_list.add(geometry_name)
-        mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    if not isinstance(geometry_name, str):
+        geometry_name = mfn_mesh.fullPathName()
 
-    elif isinstance(geometry_name, om2.MFnMesh):
-        mfn_mesh = geometry_name
-
-    mfn_mesh.getUVs()
     u_array, v_array = mfn_mesh.getUVs()
 
-    if output_bool is True:  # when finds the first intersection return True right away
-        list_uv = set()
-        for u_cord, v_cord in zip(u_array, v_array):
-            uv_cord = (u_cord, v_cord)
-            if uv_cord in list_uv:
-                return True
-            list_uv.add(uv_cord)
-        return False
+    if output_bool is True:
+        # the set is built in a single C pass. Fewer unique coordinates means overlapping UV
+        return len(set(zip(u_array, v_array))) != len(u_array)
 
-    else:
-        list_uv = set()
-        list_uv_overlapping = set()
-        for u_cord, v_cord, index in zip(u_array, v_array, range(len(u_array))):
-            uv_cord = (u_cord, v_cord)
-            if uv_cord in list_uv:
-                list_uv_overlapping.add(index)
-            list_uv.add(uv_cord)
-
-        list_index_uv_overlapping = {
-            f"{geometry_name}.map[{uv_index}]" for uv_index in list_uv_overlapping
-        }
-        return list_index_uv_overlapping
+    # for every coordinate store the first uv found. Any other uv that lands on the same
+    # coordinate is overlapping with it, the first one included.
+    # NOTE: hashing the (u, v) tuples is O(n), a sort over the coordinates would be O(n log n).
+    # -0.0 and 0.0 have the same hash and compare equal, so they are grouped correctly.
+    dict_cord_first_uv = {}
+    list_uv_overlapping = set()
+    for uv_index, uv_cord in enumerate(zip(u_array, v_array)):
+        first_uv_index = dict_cord_first_uv.setdefault(uv_cord, uv_index)
+        if first_uv_index != uv_index:
+            list_uv_overlapping.add(first_uv_index)
+            list_uv_overlapping.add(uv_index)
+
+    return add_full_name_to_index_component(list_uv_overlapping, geometry_name, "map")
 
 
 def get_shell_ids(
@@ -484,33 +671,141 @@ def get_shell_ids(
         shell indices, one per uv, indicating which shell that uv is part of.
     """
 
-    if isinstance(geometry_name, str):
-        selection_list = om2.MSelectionList()
-        selection_list.add(geometry_name)
-        mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
+    mfn_mesh = get_mfn_mesh(geometry_name)
+
+    return mfn_mesh.getUvShellsIds()  # type: ignore [no-any-return]
+
+
+def get_face_vertices_and_uvs(
+    mfn_mesh: om2.MFnMesh,
+    bool_read_uvs: bool = True,
+) -> List[Tuple[List[int], List[int]]]:
+    """Return the vertices and the uv points of every face of the mesh.
+    The topology is read with two bulk calls instead of walking a MItMeshPolygon.
+
+    Args:
+        mfn_mesh (om2.MFnMesh): the MFnMesh of the geometry to read.
+        bool_read_uvs (bool, optional): read the uv points too. When False the uv points of
+        every face are left empty and the mesh can have unmapped faces. Defaults to True.
 
-    elif isinstance(geometry_name, om2.MFnMesh):
-        mfn_mesh = geometry_name
+    Returns:
+        List[Tuple[List[int], List[int]]]: indexed by face id. For every face the vertices
+        and the uv points of the same face-vertices, listed in the same order.
+        A face without uv has no uv points.
+    """
 
+    polygon_counts, polygon_connects = mfn_mesh.getVertices()
+    if bool_read_uvs:
+        uv_counts, uv_ids = mfn_mesh.getAssignedUVs()
     else:
-        raise TypeError(
-            "The geometry_name variable must be either a string or a om2.MFnMesh"
-        )
+        uv_counts, uv_ids = [0] * len(polygon_counts), []
+    polygon_connects = list(polygon_connects)
+    uv_ids = list(uv_ids)
+
+    list_face = []
+    offset_vtx = 0
+    offset_uv = 0
+    for n_vtx, n_uv in zip(polygon_counts, uv_counts):
+        list_face.append((
+            polygon_connects[offset_vtx:offset_vtx + n_vtx],
+            uv_ids[offset_uv:offset_uv + n_uv],
+        ))
+        offset_vtx += n_vtx
+        offset_uv += n_uv
+
+    return list_face
+
+
+def get_vertex_uvs(
+    mfn_mesh: om2.MFnMesh,
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+) -> List[List[int]]:
+    """Return the uv points of every vertex of the mesh.
+    Replace a MItMeshVertex.getUVIndices() walk with the bulk face topology.
 
-    return mfn_mesh.getUvShellsIds()  # type: ignore [no-any-return]
+    Args:
+        mfn_mesh (om2.MFnMesh): the MFnMesh of the geometry to read.
+        list_face (List[Tuple[List[int], List[int]]], optional): the output of
+        get_face_vertices_and_uvs(). If None it will be read from the mesh. Defaults to None.
+
+    Returns:
+        List[List[int]]: indexed by vertex id. The uv points of every vertex without duplicates,
+        in the order the faces use them.
+    """
+
+    if list_face is None:
+        list_face = get_face_vertices_and_uvs(mfn_mesh)
+
+    list_vertex_uvs = [[] for _ in range(mfn_mesh.numVertices)]
+    for vertexes_face, uv_face in list_face:
+        for vtx, uv_index in zip(vertexes_face, uv_face):
+            uvs_vtx = list_vertex_uvs[vtx]
+            if uv_index not in uvs_vtx:
+                uvs_vtx.append(uv_index)
+
+    return list_vertex_uvs
+
+
+def get_edge_vertices_and_faces(
+    mfn_mesh: om2.MFnMesh,
+    list_face: List[Tuple[List[int], List[int]]],
+    bool_collect_uvs: bool = True,
+) -> List[Tuple[Tuple[int, int], List[int], Set[int]]]:
+    """Return the two vertices, the connected faces and the connected uv points
+    of every edge of the mesh.
+
+    Args:
+        mfn_mesh (om2.MFnMesh): the MFnMesh of the geometry to read.
+        list_face (List[Tuple[List[int], List[int]]]): the output of get_face_vertices_and_uvs().
+        bool_collect_uvs (bool, optional): collect the uv points of the edges. When False the uv
+        points of every edge are left empty and the faces do not need any uv. Defaults to True.
+
+    Returns:
+        List[Tuple[Tuple[int, int], List[int], Set[int]]]: indexed by edge id. For every edge
+        the two vertices, the faces connected to it and the uv points of those faces
+        that sit on the two vertices.
+    """
+
+    list_edge = []
+    dict_vertices_edge = {}
+    for edge_index in range(mfn_mesh.numEdges):
+        vtx_00, vtx_01 = mfn_mesh.getEdgeVertices(edge_index)
+        list_edge.append(((vtx_00, vtx_01), [], set()))
+        dict_vertices_edge[(min(vtx_00, vtx_01), max(vtx_00, vtx_01))] = edge_index
+
+    # every couple of consecutive face-vertices is one of the face edges. Their uv points
+    # are the uv points that the face connects to that edge.
+    for face_index, (vertexes_face, uv_face) in enumerate(list_face):
+        for i, vtx_00 in enumerate(vertexes_face):
+            vtx_01 = vertexes_face[i - 1]
+            _, face_connected_to_edge, uv_connected_to_edge = list_edge[
+                dict_vertices_edge[(min(vtx_00, vtx_01), max(vtx_00, vtx_01))]]
+            face_connected_to_edge.append(face_index)
+            if bool_collect_uvs:
+                uv_connected_to_edge.add(uv_face[i])
+                uv_connected_to_edge.add(uv_face[i - 1])
+
+    return list_edge
 
 
 def get_component_on_border(
-    geometry_name: str, mode: str
+    geometry_name: Union[str, om2.MFnMesh],
+    mode: str,
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+    list_edge: Optional[List[Tuple[Tuple[int, int], List[int], Set[int]]]] = None,
 ) -> Union[Tuple[int], Tuple[int, ...], Set[int]]:
     """Given the name of a mesh transform or shape,
     this function will return the component that live on the border.
     NOTE: When the mode "UV" is selected the default UV map set will always be used.
 
     Args:
-        geometry_name (str): The name of the geometry to check.
+        geometry_name (str) or (om2.MFnMesh): The name of the geometry to check.
         mode (str): defines with component to check.
         Possible values are [ 'vtx' , 'edge' , 'face' , 'UV' ]
+        list_face (List[Tuple[List[int], List[int]]], optional): the output of
+        get_face_vertices_and_uvs(). If None it will be read from the mesh. Defaults to None.
+        list_edge (List[Tuple[Tuple[int, int], List[int], Set[int]]], optional): the output of
+        get_edge_vertices_and_faces(). If None it will be read from the mesh. Defaults to None.
 
     Raises:
         ValueError: Wrong mode selected.
@@ -520,142 +815,99 @@ def get_component_on_border(
         or multiple series of integers in "uv" mode is selected
     """
 
-    selection_list = om2.MSelectionList()
-    selection_list.add(geometry_name)
+    if mode not in ("edge", "vtx", "face", "UV"):
+        raise ValueError(
+            "Wrong mode selected. Choose between: [ 'edge' , 'vtx' , 'face' , 'uv' ] not: ",
+            mode,
+        )
 
-    if mode == "edge":
-        mfn_mesh_edge = om2.MItMeshEdge(selection_list.getDagPath(0))
+    mfn_mesh = get_mfn_mesh(geometry_name)
 
+    if mode in ("edge", "vtx", "face"):
+        if list_edge is None:
+            # only the topology is needed here, the mesh may have no uv at all
+            list_edge = get_edge_vertices_and_faces(
+                mfn_mesh,
+                get_face_vertices_and_uvs(mfn_mesh, bool_read_uvs=False),
+                bool_collect_uvs=False,
+            )
+        # an edge is on the border when only one face is connected to it.
+        # Vertices and faces are on the border when they touch one of those edges.
         list_index_edge_on_border = set()
-        while not mfn_mesh_edge.isDone():
-            if mfn_mesh_edge.onBoundary():
-                edge_index = mfn_mesh_edge.index()
-                list_index_edge_on_border.add(edge_index)
-            mfn_mesh_edge.next()
-
-        return list_index_edge_on_border
-
-    elif mode == "vtx":
-        mfn_mesh_vtx = om2.MItMeshVertex(selection_list.getDagPath(0))
-
         list_index_vtx_on_border = set()
-        while not mfn_mesh_vtx.isDone():
-            if mfn_mesh_vtx.onBoundary():
-                vtx_index = mfn_mesh_vtx.index()
-                list_index_vtx_on_border.add(vtx_index)
-            mfn_mesh_vtx.next()
-
-        return list_index_vtx_on_border
-
-    elif mode == "face":
-        mfn_mesh_face = om2.MItMeshPolygon(selection_list.getDagPath(0))
-
         list_index_face_on_border = set()
-        while not mfn_mesh_face.isDone():
-            if mfn_mesh_face.onBoundary():
-                face_index = mfn_mesh_face.index()
-                list_index_face_on_border.add(face_index)
-            mfn_mesh_face.next()
-
+        for edge, (vertexes_edge, face_connected_to_edge, _) in enumerate(list_edge):
+            if len(face_connected_to_edge) < 2:
+                list_index_edge_on_border.add(edge)
+                list_index_vtx_on_border.update(vertexes_edge)
+                list_index_face_on_border.update(face_connected_to_edge)
+
+        if mode == "edge":
+            return list_index_edge_on_border
+        if mode == "vtx":
+            return list_index_vtx_on_border
         return list_index_face_on_border
 
-    elif mode == "UV":
-        # How this function find the UV that live on the border:
-        # For every edge it store the connected faces and the vertex of that very edge.
-        # Then get the UV from the vertex of the faces that are connected to that very edge.
-        #
-        # Note: You need to query the UV points of a face and not of a vertex because otherwise
-        # it may give you some UV that are not connected to the edge
-        #
-        # A bit of theory:
-        #
-        # The number of UV connection of a face will always be equal to the number of vtx in a face.
-        #
-        # You can find an edge that live on the UV border if that has one the following specs:
-        # - It has more than two UV connection
-        # - it has less than two connected faces
-
-        mfn_mesh_edge = om2.MItMeshEdge(selection_list.getDagPath(0))
-        mfn_mesh_face = om2.MItMeshPolygon(selection_list.getDagPath(0))
-
-        dict_edge = {}
-        dict_face: Dict[int, Tuple[List[int], List[int]]] = {}
-        list_index_uv_on_border = set()
-        list_index_edge_on_uv_border = set()
-        list_index_vtx_on_uv_border = set()
-        list_index_face_on_uv_border = set()
-
-        while not mfn_mesh_edge.isDone():
-            dict_edge[mfn_mesh_edge.index()] = set(mfn_mesh_edge.getConnectedFaces()), [
-                mfn_mesh_edge.vertexId(0),
-                mfn_mesh_edge.vertexId(1),
-            ]
-            mfn_mesh_edge.next()
-        while not mfn_mesh_face.isDone():
-            vtx_connected_to_face = mfn_mesh_face.getVertices()
-            uv_connected_to_face = []
-            for i in range(len(vtx_connected_to_face)):
-                uv_connected_to_face.append(mfn_mesh_face.getUVIndex(i))
-
-            dict_face[mfn_mesh_face.index()] = (
-                mfn_mesh_face.getVertices(),
-                uv_connected_to_face,
-            )
-            mfn_mesh_face.next()
-        for edge, value_edge in dict_edge.items():
-            is_edge_on_border = None
-            uv_connected_to_edge = set()
-            face_connected_to_edge = value_edge[0]
-            vertexes_edge = value_edge[1]
-
-            for face in face_connected_to_edge:
-                vertexes_face = dict_face.get(face)[0]
-                for i, vtx in enumerate(vertexes_face):
-                    if vtx in vertexes_edge:
-                        uv_point = dict_face.get(face)[1][i]
-                        uv_connected_to_edge.add(uv_point)
-
-            if len(uv_connected_to_edge) > 2:
-                is_edge_on_border = True
-
-            elif len(face_connected_to_edge) < 2:
-                is_edge_on_border = True
-
-            if is_edge_on_border:
-                for uv_index in uv_connected_to_edge:
-                    list_index_uv_on_border.add(uv_index)
-                for face in face_connected_to_edge:
-                    list_index_face_on_uv_border.add(face)
-                list_index_vtx_on_uv_border.update(vertexes_edge)
-                list_index_edge_on_uv_border.add(edge)
-
-        return (
-            list_index_uv_on_border,
-            list_index_vtx_on_uv_border,
-            list_index_edge_on_uv_border,
-            list_index_face_on_uv_border,
-        )
+    if list_edge is None:
+        if list_face is None:
+            list_face = get_face_vertices_and_uvs(mfn_mesh)
+        list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
 
-    else:
-        raise ValueError(
-            "Wrong mode selected. Choose between: [ 'edge' , 'vtx' , 'face' , 'uv' ] not: ",
-            mode,
-        )
+    # How this function find the UV that live on the border:
+    # For every edge it store the connected faces and the vertex of that very edge.
+    # Then get the UV from the vertex of the faces that are connected to that very edge.
+    #
+    # Note: You need to query the UV points of a face and not of a vertex because otherwise
+    # it may give you some UV that are not connected to the edge
+    #
+    # A bit of theory:
+    #
+    # The number of UV connection of a face will always be equal to the number of vtx in a face.
+    #
+    # You can find an edge that live on the UV border if that has one the following specs:
+    # - It has more than two UV connection
+    # - it has less than two connected faces
+
+    list_index_uv_on_border = set()
+    list_index_edge_on_uv_border = set()
+    list_index_vtx_on_uv_border = set()
+    list_index_face_on_uv_border = set()
+
+    for edge, (vertexes_edge, face_connected_to_edge, uv_connected_to_edge) in enumerate(
+            list_edge):
+        if len(uv_connected_to_edge) > 2 or len(face_connected_to_edge) < 2:
+            list_index_uv_on_border.update(uv_connected_to_edge)
+            list_index_face_on_uv_border.update(face_connected_to_edge)
+            list_index_vtx_on_uv_border.update(vertexes_edge)
+            list_index_edge_on_uv_border.add(edge)
+
+    return (
+        list_index_uv_on_border,
+        list_index_vtx_on_uv_border,
+        list_index_edge_on_uv_border,
+        list_index_face_on_uv_border,
+    )
 
 
 def get_neighbors_uv_on_border(
-    geometry_name: str,
+    geometry_name: Union[str, om2.MFnMesh],
     list_edge_on_uv_border_index: Set[int],
     list_face_on_uv_border_index: Set[int],
     list_uv_on_border_index: Set[int],
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+    list_edge: Optional[List[Tuple[Tuple[int, int], List[int], Set[int]]]] = None,
 ) -> Dict[int, Tuple[int, int]]:
     """Given the name of a mesh return the uv neighbors of every uv point.
 
     Args:
-        geometry_name (str): The name of the geometry to check.
+        geometry_name (str) or (om2.MFnMesh): The name of the geometry to check.
         list_edge_on_uv_border_index (Set[int]): sequence of edge index that live on the uv border.
         list_face_on_uv_border_index (Set[int]): sequence of face index that live on the uv border.
         list_uv_on_border_index (Set[int]): sequence of indices of uv that live on the uv border
+        list_face (List[Tuple[List[int], List[int]]], optional): the output of
+        get_face_vertices_and_uvs(). If None it will be read from the mesh. Defaults to None.
+        list_edge (List[Tuple[Tuple[int, int], List[int], Set[int]]], optional): the output of
+        get_edge_vertices_and_faces(). If None it will be read from the mesh. Defaults to None.
 
     Raises:
         RuntimeError: Expected other value. The logic needs refinement.
@@ -682,186 +934,137 @@ def get_neighbors_uv_on_border(
     # if three neighbors are found then try to find the the two vtx in common between the two faces.
     # get the uv point of those two vtx and subtract the master uv point to the uv point just found.
 
-    selection_list = om2.MSelectionList()
-    selection_list.add(geometry_name)
-    mfn_mesh_edge = om2.MItMeshEdge(selection_list.getDagPath(0))
-    mfn_mesh_face = om2.MItMeshPolygon(selection_list.getDagPath(0))
-
-    dict_face = {}
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    if not isinstance(geometry_name, str):
+        geometry_name = mfn_mesh.fullPathName()
+
+    if list_face is None:
+        list_face = get_face_vertices_and_uvs(mfn_mesh)
+    if list_edge is None:
+        list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
+    # for every face on the border store the uv of every one of its vtx
+    dict_face = {
+        face: dict(zip(*list_face[face])) for face in list_face_on_uv_border_index
+    }
     dict_edge = {}
     dict_neighbor_uv = {}
 
-    while not mfn_mesh_edge.isDone():
-        current_edge_index = mfn_mesh_edge.index()
-
-        if current_edge_index in list_edge_on_uv_border_index:
-            dict_edge[mfn_mesh_edge.index()] = (
-                set(mfn_mesh_edge.getConnectedFaces()),
-                set(mfn_mesh_edge.getConnectedEdges()),
-                [mfn_mesh_edge.vertexId(0), mfn_mesh_edge.vertexId(1)],
-            )
-
-        mfn_mesh_edge.next()
-
-    while not mfn_mesh_face.isDone():
-        current_face_index = mfn_mesh_face.index()
+    dict_vtx_edge = {}
+    for edge, (vertexes_edge, _, _) in enumerate(list_edge):
+        for vtx in vertexes_edge:
+            dict_vtx_edge.setdefault(vtx, []).append(edge)
+
+    for current_edge_index in list_edge_on_uv_border_index:
+        vertexes_edge, face_connected_to_edge, _ = list_edge[current_edge_index]
+        connected_edges = set(dict_vtx_edge[vertexes_edge[0]])
+        connected_edges.update(dict_vtx_edge[vertexes_edge[1]])
+        connected_edges.discard(current_edge_index)
+        dict_edge[current_edge_index] = (
+            set(face_connected_to_edge),
+            connected_edges,
+            list(vertexes_edge),
+        )
 
-        if current_face_index in list_face_on_uv_border_index:
-            vtx_connected_to_face = mfn_mesh_face.getVertices()
-            uv_connected_to_face = []
+    # the edges are visited in index order like the MItMeshEdge walk used to do,
+    # the topology is already in dict_edge so the mesh does not need to be iterated again.
+    for current_edge_index in sorted(list_edge_on_uv_border_index):
+        (
+            face_connected_to_current_edge,
+            connected_edges,
+            (vtx_current_edge_a, vtx_current_edge_b),
+        ) = dict_edge[current_edge_index]
+        # every couple of edges is symmetric: (A, B) gives the same result of (B, A).
+        # Process it only from the edge with the lower index.
+        connected_edges_on_border = {
+            edge for edge in connected_edges
+            if edge > current_edge_index and edge in list_edge_on_uv_border_index
+        }
 
-            for i in range(len(vtx_connected_to_face)):
-                uv_connected_to_face.append(mfn_mesh_face.getUVIndex(i))
+        for other_edge in connected_edges_on_border:
+            (
+                face_connected_to_other_edge,
+                _,
+                (vtx_other_edge_a, vtx_other_edge_b),
+            ) = dict_edge[other_edge]
+            # the two edges are connected so they share exactly one of their two vtx
+            if vtx_current_edge_a == vtx_other_edge_a or vtx_current_edge_a == vtx_other_edge_b:
+                common_vtx_edges = vtx_current_edge_a
+            else:
+                common_vtx_edges = vtx_current_edge_b
+            if vtx_other_edge_a == common_vtx_edges:
+                vtx_far_other_edge = vtx_other_edge_b
+            else:
+                vtx_far_other_edge = vtx_other_edge_a
+            # the three distinct vtx of the couple of edges
+            vtx_on_edges = (vtx_current_edge_a, vtx_current_edge_b, vtx_far_other_edge)
 
-            dict_face[mfn_mesh_face.index()] = (
-                mfn_mesh_face.getVertices(),
-                uv_connected_to_face,
+            face_connected_to_edges = face_connected_to_current_edge.union(
+                face_connected_to_other_edge
             )
 
-        mfn_mesh_face.next()
-
-    mfn_mesh_edge = om2.MItMeshEdge(selection_list.getDagPath(0))
-    # mfn_mesh_edge.reset()
-    list_edge_done = set()
-    while not mfn_mesh_edge.isDone():
-        current_edge_index = mfn_mesh_edge.index()
-        if current_edge_index in list_edge_on_uv_border_index:
-            connected_edges = dict_edge.get(current_edge_index)[1]
-            connected_edges_on_border = {
-                edge for edge in connected_edges if edge in list_edge_on_uv_border_index
-            }
-
-            for other_edge in connected_edges_on_border:
-                vtx_current_edge = set(dict_edge.get(current_edge_index)[2])
-                vtx_other_edge = set(dict_edge.get(other_edge)[2])
-                vtx_on_edges = vtx_other_edge.union(vtx_current_edge)
-                common_vtx_edges = vtx_other_edge & vtx_current_edge
-                common_vtx_edges = common_vtx_edges.pop()
-
-                face_connected_to_current_edge = dict_edge.get(current_edge_index)[
-                    0]
-                face_connected_to_edges = face_connected_to_current_edge.union(
-                    dict_edge.get(other_edge)[0]
-                )
+            for face in face_connected_to_edges:
+                dict_vtx_uv_current_face = dict_face[face]
+                # the keys of the dict are the vtx of the face
+                common_vtx_face = dict_vtx_uv_current_face.keys() & vtx_on_edges
+
+                if len(common_vtx_face) == 3:
+                    # the face contains both edges
+                    master_uv_point = dict_vtx_uv_current_face[common_vtx_edges]
+                    neighbor_master_uv_point = {
+                        dict_vtx_uv_current_face[vtx_e]
+                        for vtx_e in vtx_on_edges
+                        if vtx_e != common_vtx_edges
+                    }
+
+                    dict_neighbor_uv[master_uv_point] = list(
+                        neighbor_master_uv_point
+                    )
 
-                if (
-                    current_edge_index in list_edge_done
-                    and other_edge in list_edge_done
-                ):
-                    uv_master_points = set()
-                    for face in face_connected_to_edges:
-                        vertexes_current_face = dict_face.get(face)[0]
-                        uv_current_face = dict_face.get(face)[1]
-                        for i, vtx in enumerate(vertexes_current_face):
-                            if vtx == common_vtx_edges:
-                                uv_master_points.add(uv_current_face[i])
-                    uv_neighbor_already_found = True
-                    for uv_index in uv_master_points:
-                        if not uv_index in dict_neighbor_uv:
-                            uv_neighbor_already_found = False
-                    if uv_neighbor_already_found is True:
+                uv_filtered_current_face = {
+                    dict_vtx_uv_current_face[vtx_e]
+                    for vtx_e in vtx_on_edges
+                    if vtx_e in dict_vtx_uv_current_face
+                }
+                for other_face in face_connected_to_edges:
+                    if other_face == face:
                         continue
 
-                for face in face_connected_to_edges:
-                    vertexes_current_face = dict_face.get(face)[0]
-                    list_other_faces = set(face_connected_to_edges)
-                    list_other_faces.remove(face)
-                    common_vtx_face = set(
-                        vertexes_current_face
-                    ) & vtx_current_edge.union(vtx_other_edge)
-
-                    if len(common_vtx_face) == 3:
-                        uv_current_face = dict_face.get(face)[1]
-                        neighbor_master_uv_point = set()
-                        counter_master_uv_point = 0
-                        for vtx_e in vtx_on_edges:
-                            for i, vtx_f in enumerate(vertexes_current_face):
-                                if vtx_e == vtx_f:
-                                    local_id = i
-                                    if vtx_e == common_vtx_edges:
-                                        master_uv_point = uv_current_face[local_id]
-                                        counter_master_uv_point += 1
-                                    else:
-                                        neighbor_master_uv_point.add(
-                                            uv_current_face[local_id]
-                                        )
-
-                        dict_neighbor_uv[master_uv_point] = list(
-                            neighbor_master_uv_point
+                    dict_vtx_uv_other_face = dict_face[other_face]
+                    uv_filtered_other_face = {
+                        dict_vtx_uv_other_face[vtx_e]
+                        for vtx_e in vtx_on_edges
+                        if vtx_e in dict_vtx_uv_other_face
+                    }
+
+                    common_uv = uv_filtered_other_face & uv_filtered_current_face
+                    if len(common_uv) == 1:
+                        master_uv_point = common_uv.pop()
+                        neighbor_master_uv_point = uv_filtered_other_face.union(
+                            uv_filtered_current_face
                         )
-
-                    for other_face in list_other_faces:
-                        uv_current_face = dict_face.get(face)[1]
-                        uv_filtered_current_face = set()
-                        for vtx_e in vtx_on_edges:
-                            for i, vtx_f in enumerate(vertexes_current_face):
-                                local_id = -1
-                                if vtx_e == vtx_f:
-                                    local_id = i
-                                    break
-                            if local_id != -1:
-                                uv_filtered_current_face.add(
-                                    uv_current_face[local_id])
-
-                        vtx_other_face = dict_face.get(other_face)[0]
-                        uv_other_face = dict_face.get(other_face)[1]
-                        uv_filtered_other_face = set()
-                        for vtx_e in vtx_on_edges:
-                            for i, vtx_f in enumerate(vtx_other_face):
-                                local_id = -1
-                                if vtx_e == vtx_f:
-                                    local_id = i
-                                    break
-                            if local_id != -1:
-                                uv_filtered_other_face.add(
-                                    uv_other_face[local_id])
-
-                        common_uv = uv_filtered_other_face & uv_filtered_current_face
-                        if len(common_uv) == 1:
-                            master_uv_point = common_uv.pop()
-                            neighbor_master_uv_point = uv_filtered_other_face.union(
-                                uv_filtered_current_face
+                        neighbor_master_uv_point.remove(master_uv_point)
+                        if len(neighbor_master_uv_point) == 2:
+                            dict_neighbor_uv[master_uv_point] = list(
+                                neighbor_master_uv_point
+                            )
+                        elif len(neighbor_master_uv_point) == 3:
+                            common_vtx_face = (dict_vtx_uv_other_face.keys()
+                                               & dict_vtx_uv_current_face.keys())
+                            common_uv = {
+                                dict_vtx_uv_current_face[vtx] for vtx in common_vtx_face}
+                            common_uv.update(
+                                dict_vtx_uv_other_face[vtx] for vtx in common_vtx_face)
+
+                            neighbor_master_uv_point = common_uv - \
+                                {master_uv_point}
+                            dict_neighbor_uv[master_uv_point] = list(
+                                neighbor_master_uv_point
                             )
-                            neighbor_master_uv_point.remove(master_uv_point)
-                            if len(neighbor_master_uv_point) == 2:
-                                dict_neighbor_uv[master_uv_point] = list(
-                                    neighbor_master_uv_point
-                                )
-                                list_edge_done.add(current_edge_index)
-                                list_edge_done.add(other_edge)
-                            elif len(neighbor_master_uv_point) == 3:
-                                common_vtx_face = set(vtx_other_face) & set(
-                                    vertexes_current_face
-                                )
-                                common_uv = {
-                                    uv_current_face[i]
-                                    for vtx in common_vtx_face
-                                    for i, vtx_f in enumerate(vertexes_current_face)
-                                    if vtx == vtx_f
-                                }
-                                common_uv = common_uv.union(
-                                    {
-                                        uv_other_face[i]
-                                        for vtx in common_vtx_face
-                                        for i, vtx_f in enumerate(vtx_other_face)
-                                        if vtx == vtx_f
-                                    }
-                                )
-
-                                neighbor_master_uv_point = common_uv - \
-                                    {master_uv_point}
-                                dict_neighbor_uv[master_uv_point] = list(
-                                    neighbor_master_uv_point
-                                )
-
-        mfn_mesh_edge.next()
 
     if len(dict_neighbor_uv) != len(list_uv_on_border_index):
-        list_uv_found = {uv_index for uv_index in dict_neighbor_uv}
-        list_uv_not_found = {
-            f"{geometry_name}.map[{uv_index}]"
-            for uv_index in list_uv_on_border_index - list_uv_found
-        }
+        list_uv_not_found = add_full_name_to_index_component(
+            list_uv_on_border_index - dict_neighbor_uv.keys(), geometry_name, "map"
+        )
         cmds.select(list_uv_not_found)
         raise RuntimeError("No neighbor for the selected uv point")
 
@@ -887,22 +1090,17 @@ def get_cord_uv_master_point_posed_mesh(
     """
 
     # for every vtx on the uv index border get its uv points.
-    selection_list = om2.MSelectionList()
-    selection_list.add(geometry_name)
-    mfn_vtx = om2.MItMeshVertex(selection_list.getDagPath(0))
-    mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
+    mfn_mesh = get_mfn_mesh(geometry_name)
 
-    dict_vtx_uv = {}
-    while not mfn_vtx.isDone():
-        dict_vtx_uv[mfn_vtx.index()] = set(mfn_vtx.getUVIndices())
-        mfn_vtx.next()
+    dict_vtx_uv = {
+        vtx: set(uv_indexes) for vtx, uv_indexes in enumerate(get_vertex_uvs(mfn_mesh))
+    }
 
     # The dictionary became uv index centric instead of vtx index centric.
     dict_uv_vtx = {}
     for vtx, uv_indexes in dict_vtx_uv.items():
         for uv_index in uv_indexes:
-            if not uv_index in dict_uv_vtx:
-                dict_uv_vtx[uv_index] = len(uv_indexes), vtx
+            dict_uv_vtx.setdefault(uv_index, (len(uv_indexes), vtx))
 
     dict_cord_master_uv_point = {}
     for uv_index, uv_neighbors in dict_neighbor_uv_on_border.items():
@@ -910,37 +1108,28 @@ def get_cord_uv_master_point_posed_mesh(
         if uv_index in dict_cord_master_uv_point:
             continue
 
-        is_master_uv_point = False
         uv_neighbor_00, uv_neighbor_01 = uv_neighbors
-        n_connection_target = dict_uv_vtx.get(uv_index)[0]
-        n_connection_neighbor_00 = dict_uv_vtx.get(uv_neighbor_00)[0]
-        n_connection_neighbor_01 = dict_uv_vtx.get(uv_neighbor_01)[0]
-
-        if n_connection_target >= 3:
-            is_master_uv_point = True
-
-        if (
-            n_connection_target > n_connection_neighbor_00
+        n_connection_target, current_vtx = dict_uv_vtx[uv_index]
+        n_connection_neighbor_00, vtx_neighbor_00 = dict_uv_vtx[uv_neighbor_00]
+        n_connection_neighbor_01, vtx_neighbor_01 = dict_uv_vtx[uv_neighbor_01]
+
+        # the checks stop at the first one that succeed
+        is_master_uv_point = (
+            n_connection_target >= 3
+            or n_connection_target > n_connection_neighbor_00
             or n_connection_target > n_connection_neighbor_01
-        ):
-            is_master_uv_point = True
-
-        # if the current vtx is on the border and one or more neighbor vtx are not then ignore it.
-        if is_master_uv_point is False:
-            vtx_neighbor_00 = dict_uv_vtx.get(uv_neighbor_00)[1]
-            vtx_neighbor_01 = dict_uv_vtx.get(uv_neighbor_01)[1]
-            current_vtx = dict_uv_vtx.get(uv_index)[1]
-
-            if current_vtx in list_vertex_index_on_border:
-                if (
-                    not vtx_neighbor_00 in list_vertex_index_on_border
-                    or not vtx_neighbor_01 in list_vertex_index_on_border
-                ):
-                    is_master_uv_point = True
+            # if the current vtx is on the border and one or more neighbor vtx are not.
+            or (
+                current_vtx in list_vertex_index_on_border
+                and (
+                    vtx_neighbor_00 not in list_vertex_index_on_border
+                    or vtx_neighbor_01 not in list_vertex_index_on_border
+                )
+            )
+        )
 
         if is_master_uv_point is True:
-            current_vtx = dict_uv_vtx.get(uv_index)[1]
-            all_uv_current_vtx = dict_vtx_uv.get(current_vtx)
+            all_uv_current_vtx = dict_vtx_uv[current_vtx]
             for uv_index in all_uv_current_vtx:
                 uv_cord = mfn_mesh.getUV(uv_index)
                 dict_cord_master_uv_point[uv_index] = uv_cord
@@ -965,33 +1154,27 @@ def unwrap(mesh_to_unwrap: str, list_vertex_on_uv_border_index: Set[int]) -> str
     unwrapped_geo = duplicate_mesh_without_set(
         mesh_to_unwrap, name_duplicate=f"{mesh_to_unwrap.split('|')[-1] }_unwrapped")[0]
 
-    vtx_to_detach = [
-        f"{unwrapped_geo}.vtx[{str(vtx)}]" for vtx in list_vertex_on_uv_border_index
-    ]
+    vtx_to_detach = list(add_full_name_to_index_component(
+        list_vertex_on_uv_border_index, unwrapped_geo, "vtx"
+    ))
 
     # leave selected the detach vertexes
     cmds.polySplitVertex(vtx_to_detach, constructionHistory=False)
     vtx_on_border_unwrapped_geo = cmds.ls(selection=True, flatten=True)
 
-    if cmds.polyEvaluate(unwrapped_geo, uv=True) != cmds.polyEvaluate(
-        unwrapped_geo, vertex=True
-    ):
+    mfn_mesh = get_mfn_mesh(unwrapped_geo)
+    if mfn_mesh.numUVs() != mfn_mesh.numVertices:
         raise RuntimeError(
             f"the mesh: {unwrapped_geo} appears to not be flatten")
 
-    selection_list = om2.MSelectionList()
-    selection_list.add(unwrapped_geo)
-    mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
-    mfn_vtx = om2.MItMeshVertex(selection_list.getDagPath(0))
-
+    # every vtx has a single uv point now. Move the vtx on the coordinate of its uv
     list_coordinate_uv_point = mfn_mesh.getUVs()
-    point_array = om2.MFloatPointArray()
-    while not mfn_vtx.isDone():
-        uv_index = mfn_vtx.getUVIndices()[0]
-        u_cord = list_coordinate_uv_point[0][uv_index]
-        v_cord = list_coordinate_uv_point[1][uv_index]
-        point_array.append(om2.MFloatPoint(u_cord, v_cord, 0))
-        mfn_vtx.next()
+    list_u_cord, list_v_cord = list_coordinate_uv_point
+    # build the whole array in one go instead of appending vtx by vtx
+    point_array = om2.MFloatPointArray([
+        om2.MFloatPoint(list_u_cord[uv_indexes[0]], list_v_cord[uv_indexes[0]], 0)
+        for uv_indexes in get_vertex_uvs(mfn_mesh)
+    ])
 
     mfn_mesh.setPoints(point_array)
     cmds.polyMergeVertex(
@@ -1011,8 +1194,10 @@ def unwrap(mesh_to_unwrap: str, list_vertex_on_uv_border_index: Set[int]) -> str
 
     mesh_to_unwrap_bb = cmds.exactWorldBoundingBox(
         mesh_to_unwrap, calculateExactly=True)
-    unwrapped_geo_bb = cmds.exactWorldBoundingBox(
-        unwrapped_geo, calculateExactly=True)
+    # every vtx of the unwrapped geo has been moved on its uv coordinate with z = 0,
+    # so its bounding box is the one of the uv points. No need to scan the mesh again.
+    unwrapped_geo_bb = [min(list_u_cord), min(list_v_cord), 0.0,
+                        max(list_u_cord), max(list_v_cord), 0.0]
 
     mesh_to_unwrap_bb += [abs(mesh_to_unwrap_bb[0] - mesh_to_unwrap_bb[3]), abs(
         mesh_to_unwrap_bb[1] - mesh_to_unwrap_bb[4]),
@@ -1057,9 +1242,8 @@ def dict_uv_cord_to_compare_to(
         that live on the uv border. The value is the corresponding coordinate of that point.
     """
 
-    if cmds.polyEvaluate(geometry_name, uv=True) == cmds.polyEvaluate(
-        geometry_name, vertex=True
-    ):
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    if mfn_mesh.numUVs() == mfn_mesh.numVertices:
         is_mesh_uv_flatten = True
     else:
         is_mesh_uv_flatten = False
@@ -1069,18 +1253,17 @@ def dict_uv_cord_to_compare_to(
             "The list of uv that live on the UV border needs to be provided."
         )
 
-    selection_list = om2.MSelectionList()
-    selection_list.add(geometry_name)
-    mfn_mesh = om2.MFnMesh(selection_list.getDagPath(0))
     list_coordinate_uv_point = mfn_mesh.getUVs()
     if is_mesh_uv_flatten is True:
-        mfn_mesh_vtx = om2.MItMeshVertex(selection_list.getDagPath(0))
+        list_face = get_face_vertices_and_uvs(mfn_mesh)
+        list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
+        list_vertex_uvs = get_vertex_uvs(mfn_mesh, list_face)
+        # a vtx is on the border when one of its edges has only one connected face
         list_uv_on_border_index = set()
-        while not mfn_mesh_vtx.isDone():
-            if mfn_mesh_vtx.onBoundary():
-                for uv_index in mfn_mesh_vtx.getUVIndices():
-                    list_uv_on_border_index.add(uv_index)
-            mfn_mesh_vtx.next()
+        for vertexes_edge, face_connected_to_edge, _ in list_edge:
+            if len(face_connected_to_edge) < 2:
+                for vtx in vertexes_edge:
+                    list_uv_on_border_index.update(list_vertex_uvs[vtx])
 
     dict_uv_to_compare_to = {}
     for uv_index in list_uv_on_border_index:
@@ -1110,17 +1293,30 @@ def re_find_uv_master_point(
     """
 
     newly_found_uv_master_point = set()
-    for uv_cord in dict_cord_master_uv_point.keys():
-        target_u_cord, target_v_cord = dict_cord_master_uv_point.get(uv_cord)
+    if discard_threshold <= 0:
+        return newly_found_uv_master_point
+
+    # Put every uv in a grid with cells as big as the max distance allowed.
+    # A uv closer than the threshold can only be in the same cell of the target or in one of
+    # the 8 around it, so only those cells need to be checked instead of every uv.
+    size_cell = math.sqrt(discard_threshold)
+    dict_cell_uv = {}
+    for uv_index, (u_cord, v_cord) in dict_uv_to_compare_to.items():
+        cell = (math.floor(u_cord / size_cell), math.floor(v_cord / size_cell))
+        dict_cell_uv.setdefault(cell, []).append((uv_index, u_cord, v_cord))
+
+    for target_u_cord, target_v_cord in dict_cord_master_uv_point.values():
+        cell_u = math.floor(target_u_cord / size_cell)
+        cell_v = math.floor(target_v_cord / size_cell)
         closest_uv, closest_distance = None, float("inf")
-        for uv_index in dict_uv_to_compare_to.keys():
-            u_cord, v_cord = dict_uv_to_compare_to.get(uv_index)
-
-            distance = (u_cord - target_u_cord) ** 2 + \
-                (v_cord - target_v_cord) ** 2
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_uv = uv_index
+        for offset_u, offset_v in itertools.product((-1, 0, 1), repeat=2):
+            for uv_index, u_cord, v_cord in dict_cell_uv.get(
+                    (cell_u + offset_u, cell_v + offset_v), ()):
+                distance = (u_cord - target_u_cord) ** 2 + \
+                    (v_cord - target_v_cord) ** 2
+                if distance < closest_distance:
+                    closest_distance = distance
+                    closest_uv = uv_index
 
         if closest_distance < discard_threshold:
             newly_found_uv_master_point.add(closest_uv)
@@ -1128,210 +1324,54 @@ def re_find_uv_master_point(
     return newly_found_uv_master_point
 
 
-def calculate_path_between_two_uv_on_border(
-    start_index_uv: int,
-    end_index_uv: int,
+def get_ordered_uv_border_loops(
     dict_neighbor_uv_on_border: Dict[int, Tuple[int, int]],
-    shell_ids: List[int],
-    list_stop_point: Set[int] = None,
-) -> Union[Tuple[Set[int]], Tuple[Set[int], Set[int]], None]:
-    """Return the path between two given uv points that live on the uv border.
+) -> List[List[int]]:
+    """Split the uv that live on the uv border in closed loops, each one in walking order.
 
     Args:
-        start_index_uv (int): uv point from with the walk along the uv border will start from.
-        end_index_uv (int): uv point to reach during the walk.
         dict_neighbor_uv_on_border (Dict[int, Tuple[int, int]]): the two corresponding uv neighbors
         for every uv that live on the uv border.
-        shell_ids (List[int]): defines which shell every uv point live
-        list_stop_point (Set[int], optional): sequence of uv points that live on the uv border that
-        will break the walking loop. Defaults to None.
 
     Raises:
-        RuntimeError: the neighbors information are missing inside the dictionary.
-        RuntimeError: the while loop appears to be endless.
+        RuntimeError: the neighbors of a uv do not lead back to the start of its loop.
 
     Returns:
-        Union[ Tuple[int, Set[int]] , Tuple[int, Set[int], Set[int]], Tuple[Set[int]], None]: if the
-        path is not possible return None. Otherwise return one or two tuple containing the path.
+        List[List[int]]: every loop of uv points. The uv are in the order they are walked, starting
+        from the lowest index of the loop and going towards its first neighbor.
     """
 
-    if list_stop_point is None:
-        list_stop_point = set()
-
-    if (
-        not start_index_uv in dict_neighbor_uv_on_border.keys()
-        or not end_index_uv in dict_neighbor_uv_on_border.keys()
-    ):
-        raise RuntimeError(
-            "impossible to find the UV neighbor of the input UV point: ",
-            [start_index_uv, end_index_uv],
-        )
-
-    if shell_ids[start_index_uv] != shell_ids[end_index_uv]:
-        return None  # The two UV points are not even on the same UV shell
-
-    list_every_input_point = list_stop_point.union(
-        {start_index_uv, end_index_uv})
-
-    if start_index_uv != end_index_uv:
-        stop_while_loop = False
-        is_first_side_ok = False
-        is_second_side_ok = False
-        uv_point_loop_00 = set({start_index_uv, end_index_uv})
-        uv_point_loop_01 = set({start_index_uv, end_index_uv})
-
-        key_uv_point = dict_neighbor_uv_on_border.get(start_index_uv)[
-            0
-        ]  # start with one direction
-        if not key_uv_point in list_every_input_point:
-            list_current_neighbors = dict_neighbor_uv_on_border.get(
-                key_uv_point)
-            old_uv_point = start_index_uv
-            which_side_loop = 0
-            uv_point_loop_00.add(key_uv_point)
-
-        else:  # first side is done now try from the other side
-            if end_index_uv == key_uv_point:
-                is_first_side_ok = True
-
-            key_uv_point = dict_neighbor_uv_on_border.get(start_index_uv)[
-                1
-            ]  # try with other direction
-            if (
-                not key_uv_point in list_every_input_point
-                and start_index_uv != end_index_uv
-            ):
-                list_current_neighbors = dict_neighbor_uv_on_border.get(
-                    key_uv_point)
-                old_uv_point = start_index_uv
-                which_side_loop = 1
-                uv_point_loop_01.add(key_uv_point)
-            else:  # both sides already done
-                stop_while_loop = True
-                if end_index_uv == key_uv_point:
-                    is_second_side_ok = True
-
-        counter = 0
-        while stop_while_loop is False:
-            if counter == 10000:
-                raise RuntimeError("Counter safe limit")
-            counter += 1
-            if end_index_uv in list_current_neighbors:
-                if which_side_loop == 0:
-                    is_first_side_ok = True  # the first direction has been a success
-                    which_side_loop = 1
-                    uv_point_loop_00.add(key_uv_point)
-
-                    key_uv_point = dict_neighbor_uv_on_border.get(start_index_uv)[
-                        1]
-                    list_current_neighbors = dict_neighbor_uv_on_border.get(
-                        key_uv_point
-                    )
-                    old_uv_point = start_index_uv
-                    uv_point_loop_01.add(key_uv_point)
-
-                    if key_uv_point in list_every_input_point:
-                        if end_index_uv == key_uv_point:
-                            is_second_side_ok = True
-                            stop_while_loop = True
-                    continue
-                else:
-                    uv_point_loop_01.add(key_uv_point)
-                    is_second_side_ok = True  # the second direction has been a success
-                    stop_while_loop = True
-                    continue
-
-            if (
-                list_current_neighbors[0] in list_stop_point
-                or list_current_neighbors[1] in list_stop_point
-            ):
-                if which_side_loop == 0:
-                    which_side_loop = 1  # the first direction has failed
-                    key_uv_point = dict_neighbor_uv_on_border.get(start_index_uv)[
-                        1]
-                    list_current_neighbors = dict_neighbor_uv_on_border.get(
-                        key_uv_point
-                    )
-                    old_uv_point = start_index_uv
-                    uv_point_loop_01.add(key_uv_point)
-
-                    if key_uv_point in list_every_input_point:
-                        stop_while_loop = True
-                        if end_index_uv == key_uv_point:
-                            is_second_side_ok = True
-                            stop_while_loop = True
-
-                    continue
-
-                else:
-                    stop_while_loop = True  # the second direction has failed
-                    continue
-
-            # if nothing can stop the loop then continue to walk the UV shell border
-            if old_uv_point in list_current_neighbors:
-                dummy_var = key_uv_point
-                key_uv_point = (set(list_current_neighbors) -
-                                {old_uv_point}).pop()
-                list_current_neighbors = dict_neighbor_uv_on_border.get(
-                    key_uv_point)
-                old_uv_point = dummy_var
-
-                if which_side_loop == 0:
-                    uv_point_loop_00.add(key_uv_point)
-                else:
-                    uv_point_loop_01.add(key_uv_point)
-        if is_first_side_ok is True and is_second_side_ok is True:
-            return uv_point_loop_00, uv_point_loop_01
-        elif is_first_side_ok is True and is_second_side_ok is False:
-            return uv_point_loop_00
-        elif is_first_side_ok is False and is_second_side_ok is True:
-            return uv_point_loop_01
-        else:
-            return None
-
-    else:  # if the two input index UV point are the same then walk in only the first direction
-        key_uv_point = dict_neighbor_uv_on_border.get(start_index_uv)[0]
-        if key_uv_point in list_every_input_point:
-            return None
+    list_uv_loop = []
+    list_uv_not_walked = set(dict_neighbor_uv_on_border)
+    for start_index_uv in sorted(dict_neighbor_uv_on_border):
+        if start_index_uv not in list_uv_not_walked:
+            continue
+        uv_loop = [start_index_uv]
         old_uv_point = start_index_uv
-        list_current_neighbors = dict_neighbor_uv_on_border.get(key_uv_point)
-        uv_point_loop = set({start_index_uv, end_index_uv})
-
-        stop_while_loop = False
-        counter = 0
-        while stop_while_loop is False:
-            if counter == 10000:
+        key_uv_point = dict_neighbor_uv_on_border[start_index_uv][0]
+        while key_uv_point != start_index_uv:
+            if len(uv_loop) > len(dict_neighbor_uv_on_border):
                 raise RuntimeError("Counter safe limit")
-            counter += 1
-            if end_index_uv in list_current_neighbors:
-                if (
-                    counter != 1
-                ):  # without this the code would stop walking right after the start
-                    uv_point_loop.add(key_uv_point)
-                    return uv_point_loop
-
-            if (
-                list_current_neighbors[0] in list_stop_point
-                or list_current_neighbors[1] in list_stop_point
-            ):
-                return None
-
-            # if nothing can stop the loop then continue to walk the UV shell border
-            if old_uv_point in list_current_neighbors:
-                dummy_var = key_uv_point
-                key_uv_point = (set(list_current_neighbors) -
-                                {old_uv_point}).pop()
-                list_current_neighbors = dict_neighbor_uv_on_border.get(
-                    key_uv_point)
-                old_uv_point = dummy_var
-                uv_point_loop.add(old_uv_point)
+            uv_loop.append(key_uv_point)
+            list_current_neighbors = dict_neighbor_uv_on_border[key_uv_point]
+            # go to the neighbor that is not the one just left
+            if list_current_neighbors[0] != old_uv_point:
+                old_uv_point, key_uv_point = key_uv_point, list_current_neighbors[0]
+            else:
+                old_uv_point, key_uv_point = key_uv_point, list_current_neighbors[1]
+        list_uv_not_walked.difference_update(uv_loop)
+        list_uv_loop.append(uv_loop)
+
+    return list_uv_loop
 
 
 @overload
 def create_curve(
     geometry_name: str,
     list_input_master_uv_point: Set[int],
-    just_return_list_edge_loop_full_name: False
+    just_return_list_edge_loop_full_name: False,
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+    list_edge: Optional[List[Tuple[Tuple[int, int], List[int], Set[int]]]] = None,
 ) -> Set[str]:
     pass
 
@@ -1340,7 +1380,9 @@ def create_curve(
 def create_curve(
     geometry_name: str,
     list_input_master_uv_point: Set[int],
-    just_return_list_edge_loop_full_name: True
+    just_return_list_edge_loop_full_name: True,
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+    list_edge: Optional[List[Tuple[Tuple[int, int], List[int], Set[int]]]] = None,
 ) -> List[Set[int]]:
     pass
 
@@ -1348,13 +1390,19 @@ def create_curve(
 def create_curve(
     geometry_name: str,
     list_input_master_uv_point: Set[int],
-    just_return_list_edge_loop_full_name: bool
+    just_return_list_edge_loop_full_name: bool,
+    list_face: Optional[List[Tuple[List[int], List[int]]]] = None,
+    list_edge: Optional[List[Tuple[Tuple[int, int], List[int], Set[int]]]] = None,
 ) -> Union[Set[str], List[Set[str]]]:
     """Creates curves along the perimeter of the flatten mesh.
 
     Args:
         geometry_name (str): the name of the geometry.
         list_input_master_uv_point (Set[int]): list of master uv point that are on the flatten mesh.
+        list_face (List[Tuple[List[int], List[int]]], optional): the output of
+        get_face_vertices_and_uvs(). If None it will be read from the mesh. Defaults to None.
+        list_edge (List[Tuple[Tuple[int, int], List[int], Set[int]]], optional): the output of
+        get_edge_vertices_and_faces(). If None it will be read from the mesh. Defaults to None.
 
     Raises:
         RuntimeError: stuck in the loop that create circular closed curves.
@@ -1365,16 +1413,21 @@ def create_curve(
     """
 
     # This function will create all the curve on the perimeter of the mesh that has been UV flatten.
-    # For each possible combination of two input master UV point will check if the two point are
-    # topologically the closest to each other. If so a curve will be created from that edge path.
+    # Every loop of the UV border is walked once. Two input master UV point that come one after
+    # the other along the loop are topologically the closest to each other, so a curve will be
+    # created from the edge path between them.
     #
-    # If there are un-found UV it means that one or more shell are circle.
-    # They can have just one UV master point or even none.
-    # If walking on all the UV shell border the only UV master point found is the input one
-    # then save the edge path an create a circular curve
-
+    # If a loop has less than two UV master point it means that the shell is a circle.
+    # Then the whole loop is saved as edge path to create a circular curve.
+
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    # read the topology once, the border helpers below share it
+    if list_face is None:
+        list_face = get_face_vertices_and_uvs(mfn_mesh)
+    if list_edge is None:
+        list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
     list_component_on_uv_border = get_component_on_border(
-        geometry_name, mode="UV")
+        mfn_mesh, mode="UV", list_face=list_face, list_edge=list_edge)
     (
         list_edge_on_uv_border_index,
         list_face_on_uv_border_index,
@@ -1389,112 +1442,133 @@ def create_curve(
         list_edge_on_uv_border_index,
         list_face_on_uv_border_index,
         list_uv_on_border_index,
+        list_face=list_face,
+        list_edge=list_edge,
     )
-    shell_ids = get_shell_ids(geometry_name)[1]
-    list_index_uv_found = set()
-    dict_edge_loop_path = {}
-
-    for uv_pair in itertools.combinations(list_input_master_uv_point, 2):
-        list_index_uv_path = calculate_path_between_two_uv_on_border(
-            uv_pair[0],
-            uv_pair[1],
-            dict_neighbor_uv_on_border,
-            shell_ids,
-            list_input_master_uv_point - {uv_pair[0], uv_pair[1]},
+    missing_master_uv_point = list_input_master_uv_point - dict_neighbor_uv_on_border.keys()
+    if missing_master_uv_point:
+        raise RuntimeError(
+            "impossible to find the UV neighbor of the input UV point: ",
+            missing_master_uv_point,
         )
-        if list_index_uv_path is None:
+
+    list_uv_path = []
+    list_uv_circular_path = []
+    for list_uv_loop in get_ordered_uv_border_loops(dict_neighbor_uv_on_border):
+        list_position_master_uv_point = [
+            position for position, uv_index in enumerate(list_uv_loop)
+            if uv_index in list_input_master_uv_point
+        ]
+        if len(list_position_master_uv_point) < 2:
+            # start the circle from its master uv point if it has one
+            position_start = list_position_master_uv_point[0] if list_position_master_uv_point \
+                else 0
+            list_uv_loop = list_uv_loop[position_start:] + list_uv_loop[:position_start]
+            list_uv_circular_path.append(list_uv_loop + list_uv_loop[:1])
             continue
-        if isinstance(list_index_uv_path, tuple):
-            path_00 = add_full_name_to_index_component(
-                list_index_uv_path[0], geometry_name, "map")
-            path_00 = cmds.polyListComponentConversion(
-                path_00,
-                fromUV=True,
-                toEdge=True,
-                internal=True)
-            path_00 = flatten_selection_list(path_00)
-            dict_edge_loop_path[f"{uv_pair[0]} , {uv_pair[1]}"] = path_00
-            path_01 = add_full_name_to_index_component(
-                list_index_uv_path[1], geometry_name, "map")
-            path_01 = cmds.polyListComponentConversion(
-                path_01,
-                fromUV=True,
-                toEdge=True,
-                internal=True)
-            path_01 = flatten_selection_list(path_01)
-            dict_edge_loop_path[f"{uv_pair[0]} , {uv_pair[1]} , {2}"] = path_01
-            list_index_uv_found.update(
-                list_index_uv_path[0], list_index_uv_path[1])
-        if isinstance(list_index_uv_path, set):
-            path_00 = add_full_name_to_index_component(
-                list_index_uv_path, geometry_name, "map")
-            path_00 = cmds.polyListComponentConversion(
-                path_00,
-                fromUV=True,
-                toEdge=True,
-                internal=True)
-            path_00 = flatten_selection_list(path_00)
-            dict_edge_loop_path[f"{uv_pair[0]} , {uv_pair[1]}"] = path_00
-            list_index_uv_found.update(list_index_uv_path)
-
-    # some UV point are undone. Do all the circular curve
-    if len(list_uv_on_border_index) != len(list_index_uv_found):
-        list_index_uv_not_found = list_uv_on_border_index - list_index_uv_found
-        counter = 0
-        while len(list_index_uv_not_found) != 0:
-            for uv_index in list_index_uv_not_found:
-                list_index_uv_path = calculate_path_between_two_uv_on_border(
-                    uv_index, uv_index, dict_neighbor_uv_on_border, shell_ids
-                )
-                path_00 = add_full_name_to_index_component(
-                    list_index_uv_path, geometry_name, "map")
-                path_00 = cmds.polyListComponentConversion(
-                    path_00,
-                    fromUV=True,
-                    toEdge=True,
-                    internal=True,
+
+        # pair every master uv point with the next one along the loop, the last with the first.
+        # With two master uv points this gives both sides of the loop.
+        for position_start, position_end in zip(
+            list_position_master_uv_point,
+            list_position_master_uv_point[1:] + list_position_master_uv_point[:1],
+        ):
+            if position_start < position_end:
+                list_uv_path.append(list_uv_loop[position_start:position_end + 1])
+            else:
+                list_uv_path.append(
+                    list_uv_loop[position_start:] + list_uv_loop[:position_end + 1])
+
+    if just_return_list_edge_loop_full_name is False:
+        # The paths are already ordered, build a linear curve through the vtx of their uv
+        # points directly instead of selecting the edges and calling cmds.polyToCurve.
+        # A uv point belongs to a single vtx. The curves follow the cage vertices, the smooth
+        # mesh preview is not conformed to.
+        list_cord_vtx = mfn_mesh.getPoints(om2.MSpace.kWorld)
+        dict_uv_vtx = {}
+        for vertexes_face, uv_face in list_face:
+            dict_uv_vtx.update(zip(uv_face, vertexes_face))
+
+        name_curve = f"{geometry_name.rsplit('|', 1)[-1]}_perimeter_01"
+        list_created_curve = set()
+        list_uv_path_and_is_circular = [(path, False) for path in list_uv_path] + [
+            (path, True) for path in list_uv_circular_path]
+        for list_index_uv_path, is_circular in list_uv_path_and_is_circular:
+            list_point = []
+            for uv_index in list_index_uv_path:
+                point = list_cord_vtx[dict_uv_vtx[uv_index]]
+                list_point.append((point.x, point.y, point.z))
+            if is_circular:
+                # the last point repeats the first one. With degree 1 a periodic curve
+                # needs as many knots as points
+                output_curve = cmds.curve(
+                    degree=1,
+                    periodic=True,
+                    point=list_point,
+                    knot=list(range(len(list_point))),
+                    name=name_curve,
                 )
-                path_00 = flatten_selection_list(path_00)
-                dict_edge_loop_path[uv_index] = path_00
-                list_index_uv_not_found = list_index_uv_not_found - list_index_uv_path
-                break
-            if counter == 10000:
-                raise RuntimeError("Infinite loop")
             else:
-                counter += 1
+                output_curve = cmds.curve(
+                    degree=1,
+                    point=list_point,
+                    name=name_curve,
+                )
+            list_created_curve.add(output_curve)
+
+        return list_created_curve
+
+    # Two uv one after the other along the border are the two uv of a border edge on one face.
+    # Store which edge joins every couple of uv so the paths can be converted without
+    # calling cmds.polyListComponentConversion for every one of them.
+    dict_uv_couple_edge = {}
+    for edge_index in list_edge_on_uv_border_index:
+        (vtx_00, vtx_01), face_connected_to_edge, _ = list_edge[edge_index]
+        for face in face_connected_to_edge:
+            dict_vtx_uv_face = dict(zip(*list_face[face]))
+            uv_00, uv_01 = dict_vtx_uv_face[vtx_00], dict_vtx_uv_face[vtx_01]
+            dict_uv_couple_edge[(min(uv_00, uv_01), max(uv_00, uv_01))] = edge_index
 
-    list_created_curve = set()
     list_edge_loop_path = []
-    for uv_point in dict_edge_loop_path:
-        edge_loop_path = dict_edge_loop_path.get(uv_point)
+    for list_index_uv_path in list_uv_path + list_uv_circular_path:
+        list_edge_index_path = {
+            dict_uv_couple_edge.get((min(uv_00, uv_01), max(uv_00, uv_01)))
+            for uv_00, uv_01 in zip(list_index_uv_path, list_index_uv_path[1:])
+        }
+        if None in list_edge_index_path:
+            # a couple of uv is not joined by a known border edge. Let Maya convert the path
+            edge_loop_path = cmds.polyListComponentConversion(
+                add_full_name_to_index_component(
+                    set(list_index_uv_path), geometry_name, "map"),
+                fromUV=True,
+                toEdge=True,
+                internal=True)
+            edge_loop_path = flatten_selection_list(edge_loop_path)
+        else:
+            edge_loop_path = add_full_name_to_index_component(
+                list_edge_index_path, geometry_name, "e")
         list_edge_loop_path.append(edge_loop_path)
-        if just_return_list_edge_loop_full_name is False:
-            cmds.select(edge_loop_path) # NOTE in maya 24 you need to select it before polyToCurve
-            output_curve = cmds.polyToCurve(
-                form=2,
-                degree=1,
-                name=f"{geometry_name.split('|')[-1]}_perimeter_01",
-                conformToSmoothMeshPreview=1,
-                constructionHistory=False,
-            )[0]
-            list_created_curve.add(output_curve)
 
-    if just_return_list_edge_loop_full_name:
-        return list_edge_loop_path
-    return list_created_curve
+    return list_edge_loop_path
 
 
 def find_closest_cord_uv_point_on_mesh_based_on_curve(
-    geometry_name: str,
     input_curve: str,
     mfn_mesh_unwrapped_geo: om2.MFnMesh,
+    list_cord_vtx_unwrapped_geo: Optional[om2.MPointArray] = None,
+    list_vertex_uvs_unwrapped_geo: Optional[List[List[int]]] = None,
 ) -> Dict[int, Tuple[float, float]]:
     """Return the closest UV point from a given curve and mesh.
 
     Args:
-        geometry_name (str): the name of the geometry.
         input_curve (str): the name of the curve.
         mfn_mesh_unwrapped_geo (om2.MFnMesh): the MFnMesh of the unwrapped geometry to reuse
+        list_cord_vtx_unwrapped_geo (om2.MPointArray, optional): the world space position of
+        every vertex of the unwrapped geometry. Pass it when calling this for many curves.
+        Defaults to None.
+        list_vertex_uvs_unwrapped_geo (List[List[int]], optional): the output of
+        get_vertex_uvs() for the unwrapped geometry. Pass it when calling this for many curves.
+        Defaults to None.
 
     Returns:
         Dict[int, Tuple[float, float]]: the key value is the index of the uv found and
@@ -1506,70 +1580,32 @@ def find_closest_cord_uv_point_on_mesh_based_on_curve(
     # else get the coordinate of the uv point closest to ep[1] because you are sure
     # that that uv point sit on a vtx that only as two UV connection.
 
+    if list_vertex_uvs_unwrapped_geo is None:
+        list_vertex_uvs_unwrapped_geo = get_vertex_uvs(mfn_mesh_unwrapped_geo)
+
     n_of_ep_on_curve = cmds.getAttr(f"{input_curve}.spans")
     if n_of_ep_on_curve > 1:
-        pos_first_ep = cmds.pointPosition(f"{input_curve}.ep[1]", world=True)
-        index_vtx_01_on_unwrapped_geo = get_closest_vertex(
-            mfn_mesh_unwrapped_geo,
-            input_position=[pos_first_ep[0], pos_first_ep[1], pos_first_ep[2]],
-        )[0]
-        vtx_01_on_unwrapped_geo = add_full_name_to_index_component(
-            index_vtx_01_on_unwrapped_geo, geometry_name, "vtx"
-        )
-        uv_01_on_unwrapped_geo = cmds.polyListComponentConversion(
-            vtx_01_on_unwrapped_geo, fromVertex=True, toUV=True
-        )[0]
-        index_uv_01_on_unwrapped_geo = get_index_component(
-            uv_01_on_unwrapped_geo)
-
-        dict_cord_uv_points_closest_to_curve = {
-            index_uv_01_on_unwrapped_geo: mfn_mesh_unwrapped_geo.getUV(
-                index_uv_01_on_unwrapped_geo
-            )
-        }
-
-        return dict_cord_uv_points_closest_to_curve
-
+        ep_to_query = f"{input_curve}.ep[1]"
     else:
-        pos_first_ep = cmds.pointPosition(f"{input_curve}.ep[0]", world=True)
-        index_vtx_01_on_unwrapped_geo = get_closest_vertex(
-            mfn_mesh_unwrapped_geo,
-            input_position=[pos_first_ep[0], pos_first_ep[1], pos_first_ep[2]],
-        )[0]
-        vtx_01_on_unwrapped_geo = add_full_name_to_index_component(
-            index_vtx_01_on_unwrapped_geo, geometry_name, "vtx"
-        )
-        uv_01_on_unwrapped_geo = cmds.polyListComponentConversion(
-            vtx_01_on_unwrapped_geo, fromVertex=True, toUV=True
-        )[0]
-        index_uv_01_on_unwrapped_geo = get_index_component(
-            uv_01_on_unwrapped_geo)
-
-        pos_second_ep = cmds.pointPosition(f"{input_curve}.ep[1]", world=True)
-        index_vtx_02_on_unwrapped_geo = get_closest_vertex(
-            mfn_mesh_unwrapped_geo,
-            input_position=[pos_second_ep[0],
-                            pos_second_ep[1], pos_second_ep[2]],
-        )[0]
-        vtx_02_on_unwrapped_geo = add_full_name_to_index_component(
-            index_vtx_02_on_unwrapped_geo, geometry_name, "vtx"
+        ep_to_query = f"{input_curve}.ep[0:1]"
+    # a single query for all the ep, xform returns their positions one after the other
+    list_flat_pos_ep = cmds.xform(ep_to_query, query=True, worldSpace=True, translation=True)
+    list_pos_ep = [
+        list_flat_pos_ep[index:index + 3] for index in range(0, len(list_flat_pos_ep), 3)
+    ]
+
+    # the unwrapped geometry has a single uv point on every vtx, no need to convert the
+    # component with cmds.polyListComponentConversion
+    dict_cord_uv_points_closest_to_curve = {}
+    for index_vtx_on_unwrapped_geo, _ in get_closest_vertices(
+        mfn_mesh_unwrapped_geo, list_pos_ep, list_cord_vtx=list_cord_vtx_unwrapped_geo
+    ):
+        index_uv_on_unwrapped_geo = list_vertex_uvs_unwrapped_geo[index_vtx_on_unwrapped_geo][0]
+        dict_cord_uv_points_closest_to_curve[index_uv_on_unwrapped_geo] = (
+            mfn_mesh_unwrapped_geo.getUV(index_uv_on_unwrapped_geo)
         )
-        uv_02_on_unwrapped_geo = cmds.polyListComponentConversion(
-            vtx_02_on_unwrapped_geo, fromVertex=True, toUV=True
-        )[0]
-        index_uv_02_on_unwrapped_geo = get_index_component(
-            uv_02_on_unwrapped_geo)
-
-        dict_cord_uv_points_closest_to_curve = {
-            index_uv_01_on_unwrapped_geo: mfn_mesh_unwrapped_geo.getUV(
-                index_uv_01_on_unwrapped_geo
-            ),
-            index_uv_02_on_unwrapped_geo: mfn_mesh_unwrapped_geo.getUV(
-                index_uv_02_on_unwrapped_geo
-            ),
-        }
 
-        return dict_cord_uv_points_closest_to_curve
+    return dict_cord_uv_points_closest_to_curve
 
 
 def bind_curve(
@@ -1598,9 +1634,22 @@ def bind_curve(
     list_close_curve = set()
     list_open_curve = set()
     list_pair_curve = []
-    for curve in list_all_created_curve:
-        form = cmds.getAttr(f"{curve}.form")
-        if form == 0:  # the curve is open
+    dict_curve_pair = {}  # every curve already paired and its pair
+
+    def add_pair_curve(curve_00: str, curve_01: str) -> None:
+        pair_curve = {curve_00, curve_01}
+        for pair in (dict_curve_pair.get(curve_00), dict_curve_pair.get(curve_01)):
+            if pair is not None and pair != pair_curve:
+                raise RuntimeError("Pair already done with another", pair, pair_curve)
+        if curve_00 not in dict_curve_pair:
+            list_pair_curve.append(pair_curve)
+            dict_curve_pair[curve_00] = pair_curve
+            dict_curve_pair[curve_01] = pair_curve
+
+    # resolve every curve once, the form, the distances and the bounding boxes are read on them
+    dict_mfn_curve = get_mfn_nurbs_curves(list_all_created_curve)
+    for curve, mfn_curve in dict_mfn_curve.items():
+        if mfn_curve.form == om2.MFnNurbsCurve.kOpen:
             list_open_curve.add(curve)
         else:
             list_close_curve.add(curve)
@@ -1610,37 +1659,38 @@ def bind_curve(
     selection_list.add(unwrapped_geo)
     mfn_mesh_posed_geometry = om2.MFnMesh(selection_list.getDagPath(0))
     mfn_mesh_unwrapped_geo = om2.MFnMesh(selection_list.getDagPath(1))
-    mfn_vtx_posed_geometry = om2.MItMeshVertex(selection_list.getDagPath(0))
-    dict_vtx_connection = {}
-
-    while not mfn_vtx_posed_geometry.isDone():
-        dict_vtx_connection[mfn_vtx_posed_geometry.index()] = set(
-            mfn_vtx_posed_geometry.getUVIndices()
-        )
-        mfn_vtx_posed_geometry.next()
-
-    dict_uv_connection = {}
-    for vtx, indexes_uv_point in dict_vtx_connection.items():
+    # every uv point belongs to a single vtx, read them all from the bulk face topology
+    list_vertex_uvs = get_vertex_uvs(mfn_mesh_posed_geometry)
+    # the uv indices are dense, a list indexed by uv maps every uv point back to its vtx
+    list_uv_vertex = [None] * mfn_mesh_posed_geometry.numUVs()
+    for vtx, indexes_uv_point in enumerate(list_vertex_uvs):
         for uv_index in indexes_uv_point:
-            if not uv_index in dict_uv_connection:
-                dict_uv_connection[uv_index] = vtx
-
+            list_uv_vertex[uv_index] = vtx
+
+    # read the vertex positions once, every curve will query the closest vertex on them
+    list_cord_vtx_unwrapped_geo = mfn_mesh_unwrapped_geo.getPoints(om2.MSpace.kWorld)
+    list_vertex_uvs_unwrapped_geo = get_vertex_uvs(mfn_mesh_unwrapped_geo)
+    # the uv to compare to do not change from curve to curve, read them once
+    dict_uv_cord_posed_geometry = dict_uv_cord_to_compare_to(
+        posed_geometry, list_uv_on_border_index)
     dict_closest_uv_to_curve = {}
     for curve in list_all_created_curve:
         dict_cord_uv_points_closest_to_curve = (
             find_closest_cord_uv_point_on_mesh_based_on_curve(
-                unwrapped_geo, curve, mfn_mesh_unwrapped_geo
+                curve,
+                mfn_mesh_unwrapped_geo,
+                list_cord_vtx_unwrapped_geo,
+                list_vertex_uvs_unwrapped_geo,
             )
         )
         list_uv_point_on_posed_mesh = re_find_uv_master_point(
             dict_cord_uv_points_closest_to_curve,
-            dict_uv_cord_to_compare_to(
-                posed_geometry, list_uv_on_border_index),
+            dict_uv_cord_posed_geometry,
         )
         list_all_uv_connection = set()
         for uv_index in list_uv_point_on_posed_mesh:
             list_all_uv_connection.update(
-                dict_vtx_connection.get(dict_uv_connection.get(uv_index))
+                list_vertex_uvs[list_uv_vertex[uv_index]]
             )
 
         dict_closest_uv_to_curve[curve] = (
@@ -1656,34 +1706,36 @@ def bind_curve(
         else:
             curve_with_two_ep.add(curve)
 
+    # which open curves start or end on every uv, so a curve only looks at the curves sharing
+    # its uvs instead of intersecting its uvs with every open curve
+    dict_uv_open_curve = {}
+    for curve_02 in list_open_curve:
+        for uv_index in dict_closest_uv_to_curve.get(curve_02)[0]:
+            dict_uv_open_curve.setdefault(uv_index, []).append(curve_02)
+
     for curve in curve_with_two_ep:
         couple_uv_index, all_uv_indexes = dict_closest_uv_to_curve.get(curve)
         list_uv_to_search_couple_in = all_uv_indexes - couple_uv_index
         if len(list_uv_to_search_couple_in) >= 2:
-            for curve_02 in list_open_curve:
-                if curve == curve_02:
-                    continue
-
-                common_uv = (
-                    list_uv_to_search_couple_in
-                    & dict_closest_uv_to_curve.get(curve_02)[0]
-                )
-
-                if len(common_uv) == 2:
-                    pair_already_exist = False
-                    for pair in list_pair_curve:
-                        if curve in pair or curve_02 in pair:
-                            if pair != {curve, curve_02}:
-                                raise RuntimeError(
-                                    "Pair already done with another",
-                                    pair,
-                                    {curve, curve_02},
-                                )
-                        if pair == {curve, curve_02}:
-                            pair_already_exist = True
-                    if not pair_already_exist:
-                        list_pair_curve.append({curve, curve_02})
-
+            counter_common_uv = collections.Counter(
+                curve_02
+                for uv_index in list_uv_to_search_couple_in
+                for curve_02 in dict_uv_open_curve.get(uv_index, ())
+            )
+            for curve_02, n_common_uv in counter_common_uv.items():
+                if curve_02 != curve and n_common_uv == 2:
+                    add_pair_curve(curve, curve_02)
+
+    # read the uv of the unwrapped geo once, they are needed again for every curve with three ep
+    # or more
+    dict_uv_cord_unwrapped_geo = dict_uv_cord_to_compare_to(unwrapped_geo)
+    # create_curve builds the perimeter curves with cmds.curve from world space points, their
+    # transform stays at identity so their bounding box is already in world space.
+    # The pointer curves below rely on it too.
+    list_curve_bounding_box = [
+        (curve_02, mfn_curve, mfn_curve.boundingBox)
+        for curve_02, mfn_curve in dict_mfn_curve.items()
+    ]
     for curve in curve_with_at_least_three_ep:
         direct_uv_index, all_uv_indexes = dict_closest_uv_to_curve.get(curve)
         if all_uv_indexes == direct_uv_index:
@@ -1692,7 +1744,7 @@ def bind_curve(
         dict_uv_cord = {other_uv: mfn_mesh_posed_geometry.getUV(other_uv)}
         uv_point_on_unwrapped_geo = (
             re_find_uv_master_point(
-                dict_uv_cord, dict_uv_cord_to_compare_to(unwrapped_geo)
+                dict_uv_cord, dict_uv_cord_unwrapped_geo
             )
         ).pop()
         uv_point_full_name_on_unwrapped_geo = add_full_name_to_index_component(
@@ -1708,13 +1760,20 @@ def bind_curve(
             vtx_point_on_unwrapped_geo, space=om2.MSpace.kWorld
         )
 
+        # a curve is never closer than its bounding box. Measure the curves starting from the
+        # closest box and stop once a box is farther than the closest curve already found.
+        list_curve_lower_bound = []
+        for curve_02, mfn_curve, bounding_box in list_curve_bounding_box:
+            lower_bound = get_distance_to_bounding_box(
+                pos_vtx_point_on_unwrapped_geo, bounding_box.min, bounding_box.max)
+            list_curve_lower_bound.append((lower_bound, curve_02, mfn_curve))
+        list_curve_lower_bound.sort(key=lambda item: item[0])
+
         closest_curve = None
         closest_distance = float("inf")
-        for curve_02 in list_all_created_curve:
-            selection_list = om2.MSelectionList()
-            selection_list.add(curve_02)
-            mfn_curve = om2.MFnNurbsCurve(selection_list.getDagPath(0))
-
+        for lower_bound, curve_02, mfn_curve in list_curve_lower_bound:
+            if lower_bound >= closest_distance:
+                break
             distance = mfn_curve.distanceToPoint(
                 pos_vtx_point_on_unwrapped_geo, space=om2.MSpace.kWorld
             )
@@ -1722,55 +1781,44 @@ def bind_curve(
                 closest_curve = curve_02
                 closest_distance = distance
 
-        pair_already_exist = False
-        for pair in list_pair_curve:
-            if curve in pair or closest_curve in pair:
-                if pair != {curve, closest_curve}:
-                    raise RuntimeError(
-                        "Pair already done with another", pair, {
-                            curve, closest_curve}
-                    )
-            if pair == {curve, closest_curve}:
-                pair_already_exist = True
-        if not pair_already_exist:
-            list_pair_curve.append({curve, closest_curve})
+        add_pair_curve(curve, closest_curve)
 
     # now define the aesthetical attributes
-    for curve in list_all_created_curve:
-        curve_shape_node = cmds.listRelatives(
-            curve, shapes=True, path=True)[0]
+    # every created curve has a single shape, query them all at once
+    list_curve = list(dict_mfn_curve)
+    dict_curve_shape_node = dict(
+        zip(list_curve, cmds.listRelatives(list_curve, shapes=True, path=True)))
+    for curve, curve_shape_node in dict_curve_shape_node.items():
         cmds.setAttr(curve_shape_node + ".overrideColor", 1)  # set black color
         cmds.setAttr(curve_shape_node + ".overrideEnabled", 1)
         cmds.setAttr(curve_shape_node + ".lineWidth", 5)
-        cmds.setAttr(curve_shape_node + ".lineWidth", 5)
         # cmds.setAttr(curve_shape_node + ".overrideDisplayType", 1)
 
-        dummy_attr_perimeter_pointer_curve = (
-            "connection_between_perimeter_and_pointer_curve"
-        )  # use during the mouse evaluation
+    dummy_attr_perimeter_pointer_curve = (
+        "connection_between_perimeter_and_pointer_curve"
+    )  # use during the mouse evaluation
 
-        cmds.addAttr(
-            curve,
-            longName=dummy_attr_perimeter_pointer_curve,
-            attributeType="long",
-            min=0,
-            max=0,
-            defaultValue=0,
-            hidden=True,
-        )
+    # addAttr accepts many nodes, add the attribute to every curve with a single call
+    cmds.addAttr(
+        list_curve,
+        longName=dummy_attr_perimeter_pointer_curve,
+        attributeType="long",
+        min=0,
+        max=0,
+        defaultValue=0,
+        hidden=True,
+    )
 
     color_index = 4  # I do not like the other color that is all
+    short_name_posed_geometry = posed_geometry.rsplit("|", 1)[-1]
     list_pointer_curve_created = set()
+    list_pointer_curve_and_couple = []
     for pair in list_pair_curve:
         couple_perimeter_curve = list(pair)
 
-        selection_list = om2.MSelectionList()
-        selection_list.add(couple_perimeter_curve[0])
-        selection_list.add(couple_perimeter_curve[1])
-
-        mfn_curve_00 = om2.MFnNurbsCurve(selection_list.getDagPath(0))
+        mfn_curve_00 = dict_mfn_curve[couple_perimeter_curve[0]]
         bounding_box_00 = mfn_curve_00.boundingBox
-        mfn_curve_01 = om2.MFnNurbsCurve(selection_list.getDagPath(1))
+        mfn_curve_01 = dict_mfn_curve[couple_perimeter_curve[1]]
         bounding_box_01 = mfn_curve_01.boundingBox
         bounding_box_00_center = bounding_box_00.center
         bounding_box_01_center = bounding_box_01.center
@@ -1779,42 +1827,50 @@ def bind_curve(
             (bounding_box_00_center.y + bounding_box_01_center.y) / 2.0,
             (bounding_box_00_center.z + bounding_box_01_center.z) / 2.0,
         )
-        distance = bounding_box_00_center.distanceTo(bounding_box_01_center)
-        scaled_distance = distance * 0.9  # optional but nicer to see
+        # shrink the pointer towards its center, optional but nicer to see.
+        # the ratio is constant, measuring the distance between the centers is not needed
+        ratio_scale_pointer = 0.9
         scaled_point_00 = center_point + (
-            (bounding_box_00_center - center_point) * scaled_distance / distance
+            (bounding_box_00_center - center_point) * ratio_scale_pointer
         )
         scaled_point_01 = center_point + (
-            (bounding_box_01_center - center_point) * scaled_distance / distance
+            (bounding_box_01_center - center_point) * ratio_scale_pointer
         )
 
         pointer_curve = cmds.curve(
             degree=1,
-            name=f"{posed_geometry.split('|')[-1]}_pointer_01",
+            name=f"{short_name_posed_geometry}_pointer_01",
             point=[
                 (scaled_point_00[0], scaled_point_00[1], scaled_point_00[2]),
                 (scaled_point_01[0], scaled_point_01[1], scaled_point_01[2]),
             ],
         )
         cmds.setAttr(f"{pointer_curve}.visibility", 0)
-        new_curve_shape_node_name = cmds.listRelatives(
-            pointer_curve, shapes=True, path=True)[0]
         list_pointer_curve_created.add(pointer_curve)
-        cmds.setAttr(new_curve_shape_node_name + ".overrideColor", 1)
-        cmds.setAttr(new_curve_shape_node_name + ".overrideEnabled", 1)
-        cmds.setAttr(new_curve_shape_node_name + ".lineWidth", 5)
+        list_pointer_curve_and_couple.append(
+            (pointer_curve, couple_perimeter_curve, color_index))
 
-        curve_shape_node = cmds.listRelatives(
-            couple_perimeter_curve[0], shapes=True, path=True)[0]
-        twin_curve_shape_node = cmds.listRelatives(
-            couple_perimeter_curve[1], shapes=True, path=True)[0]
+        curve_shape_node = dict_curve_shape_node[couple_perimeter_curve[0]]
+        twin_curve_shape_node = dict_curve_shape_node[couple_perimeter_curve[1]]
         cmds.setAttr(curve_shape_node + ".overrideColor", color_index)
         cmds.setAttr(twin_curve_shape_node + ".overrideColor", color_index)
-        cmds.setAttr(new_curve_shape_node_name + ".overrideColor", color_index)
         color_index += 1
 
+    # query the shapes of all the new pointer curves at once, one shape per curve in order
+    list_pointer_curve_shape_node = cmds.listRelatives(
+        [pointer_curve for pointer_curve, _, _ in list_pointer_curve_and_couple],
+        shapes=True,
+        path=True,
+    ) if list_pointer_curve_and_couple else []
+    for new_curve_shape_node_name, (_, _, pointer_color_index) in zip(
+            list_pointer_curve_shape_node, list_pointer_curve_and_couple):
+        cmds.setAttr(new_curve_shape_node_name + ".overrideEnabled", 1)
+        cmds.setAttr(new_curve_shape_node_name + ".lineWidth", 5)
+        cmds.setAttr(new_curve_shape_node_name + ".overrideColor", pointer_color_index)
+
+    if list_pointer_curve_created:
         cmds.addAttr(
-            pointer_curve,
+            list(list_pointer_curve_created),
             longName=dummy_attr_perimeter_pointer_curve,
             attributeType="long",
             min=0,
@@ -1822,24 +1878,21 @@ def bind_curve(
             defaultValue=0,
             hidden=True,
         )
-        cmds.connectAttr(
-            f"{pointer_curve}.{dummy_attr_perimeter_pointer_curve}",
-            f"{couple_perimeter_curve[0]}.{dummy_attr_perimeter_pointer_curve}",
-        )
-        cmds.connectAttr(
-            f"{pointer_curve}.{dummy_attr_perimeter_pointer_curve}",
-            f"{couple_perimeter_curve[1]}.{dummy_attr_perimeter_pointer_curve}",
-        )
+    for pointer_curve, couple_perimeter_curve, _ in list_pointer_curve_and_couple:
+        for perimeter_curve in couple_perimeter_curve:
+            cmds.connectAttr(
+                f"{pointer_curve}.{dummy_attr_perimeter_pointer_curve}",
+                f"{perimeter_curve}.{dummy_attr_perimeter_pointer_curve}",
+            )
 
     list_perimeter_curve = list_all_created_curve
-    list_all_created_curve = list_all_created_curve.union(list_perimeter_curve)
 
     dummy_circle = cmds.circle(name="dummy_circle", ch=False)[0]
     for curve_to_sweep in list_perimeter_curve:
         nurbs = cmds.extrude(
             dummy_circle,
             curve_to_sweep,
-            name=f"{posed_geometry.split('|')[-1]}_nurbs_01",
+            name=f"{short_name_posed_geometry}_nurbs_01",
             ch=False,
             rn=False,
             po=0,
@@ -1876,8 +1929,26 @@ def dict_cord_master_uv_points_from_posed_mesh(
         dict_cord_master_uv_point (Dict[int,Tuple[float,float]]): the key is the index of the uv
 
     """
+    mfn_mesh = get_mfn_mesh(posed_ref_geometry)
+    # the master uv points only depend on the topology and on the uv of the mesh. Reading them in
+    # bulk is cheap compared to the analysis, so reuse the last result if nothing changed.
+    # The arrays are compared as they are, a hash could collide and reuse a stale result.
+    signature_mesh = tuple(
+        tuple(array)
+        for array_pair in (mfn_mesh.getVertices(), mfn_mesh.getAssignedUVs(), mfn_mesh.getUVs())
+        for array in array_pair
+    )
+    if posed_ref_geometry in DICT_CACHE_MASTER_UV_POINT:
+        cached_signature_mesh, cached_dict_cord = DICT_CACHE_MASTER_UV_POINT[posed_ref_geometry]
+        if cached_signature_mesh == signature_mesh:
+            DICT_CACHE_MASTER_UV_POINT.move_to_end(posed_ref_geometry)
+            return dict(cached_dict_cord)
+
+    # read the topology once, the border helpers below share it
+    list_face = get_face_vertices_and_uvs(mfn_mesh)
+    list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
     list_component_on_uv_border = get_component_on_border(
-        posed_ref_geometry, mode="UV")
+        mfn_mesh, mode="UV", list_face=list_face, list_edge=list_edge)
     (
         list_edge_on_uv_border_index,
         list_face_on_uv_border_index,
@@ -1888,12 +1959,14 @@ def dict_cord_master_uv_points_from_posed_mesh(
         list_component_on_uv_border[0],
     )
     list_vertex_index_on_border = get_component_on_border(
-        posed_ref_geometry, mode="vtx")
+        mfn_mesh, mode="vtx", list_edge=list_edge)
     dict_neighbor_uv_on_border = get_neighbors_uv_on_border(
         posed_ref_geometry,
         list_edge_on_uv_border_index,
         list_face_on_uv_border_index,
         list_uv_on_border_index,
+        list_face=list_face,
+        list_edge=list_edge,
     )
 
     dict_cord_master_uv_point = get_cord_uv_master_point_posed_mesh(
@@ -1901,6 +1974,11 @@ def dict_cord_master_uv_points_from_posed_mesh(
         dict_neighbor_uv_on_border,
         list_vertex_index_on_border
     )
+    DICT_CACHE_MASTER_UV_POINT[posed_ref_geometry] = (
+        signature_mesh, dict(dict_cord_master_uv_point))
+    DICT_CACHE_MASTER_UV_POINT.move_to_end(posed_ref_geometry)
+    if len(DICT_CACHE_MASTER_UV_POINT) > CACHE_MASTER_UV_POINT_MAXSIZE:
+        DICT_CACHE_MASTER_UV_POINT.popitem(last=False)  # drop the least recently used mesh
     return dict_cord_master_uv_point
 
 
@@ -1916,71 +1994,88 @@ def update_label(list_perimeter_curve: Union[str, Set[str]]) -> None:
     if isinstance(list_perimeter_curve, str):
         list_perimeter_curve = {list_perimeter_curve}
     list_shape_mesh_binded_to_label = set()
-    dict_shape_mesh_and_set = {}
-    dict_shape_mesh_and_label = {}
-    dict_shape_mesh_and_perimeter_curve = {}
+    dict_shape_mesh_and_set = collections.defaultdict(list)
+    dict_shape_mesh_and_label = collections.defaultdict(list)
+    dict_shape_mesh_and_perimeter_curve = collections.defaultdict(list)
     dict_label_and_twin_label_curve = {}
+    # the same plugs and sets are queried again for the twin curves and the slave meshes.
+    # Nothing in here changes a connection or a set, read every one of them once.
+    dict_connection = {}
+    dict_element_in_set = {}
+
+    def get_connection(plug: str) -> List[str]:
+        if plug not in dict_connection:
+            dict_connection[plug] = cmds.listConnections(plug) or []
+        return dict_connection[plug]
+
+    def get_element_in_set(edges_set: str) -> Set[str]:
+        if edges_set not in dict_element_in_set:
+            dict_element_in_set[edges_set] = flatten_selection_list(
+                cmds.sets(edges_set, query=True))
+        return dict_element_in_set[edges_set]
+
+    # every component of the same node has the same shape, resolve each node only once
+    dict_node_shape_mesh = {}
+
+    def get_shape_mesh_of_component(component: str) -> str:
+        node = component.split(".", 1)[0]
+        if node not in dict_node_shape_mesh:
+            dict_node_shape_mesh[node] = cmds.listRelatives(
+                cmds.ls(component), parent=True, type='mesh')[0]
+        return dict_node_shape_mesh[node]
+
     # this code works based on the fact that Maya will automatically assign the newly create
     # geometry inside the quick selection set. Just read the number the element that are in that set
     # an set that number to the appropriate indicator label. If the curve is binder change the color
     for perimeter_curve in list_perimeter_curve:
         if cmds.attributeQuery("connection_between_perimeter_and_pointer_curve",
                                node=perimeter_curve, exists=True):
-            if not cmds.listConnections(
+            if not get_connection(
                     f"{perimeter_curve}.connection_between_label_and_perimeter_curve"):
                 continue
-            label_curve = (cmds.listConnections(
-                f"{perimeter_curve}.connection_between_label_and_perimeter_curve").pop())
-            if not cmds.listConnections(
+            label_curve = get_connection(
+                f"{perimeter_curve}.connection_between_label_and_perimeter_curve")[-1]
+            if not get_connection(
                     f"{label_curve}.connection_between_quick_set_and_label_curve"):
                 # if the set do not exist than skip
                 continue
-            edges_set = (cmds.listConnections(
-                f"{label_curve}.connection_between_quick_set_and_label_curve").pop())
-            element_in_set = flatten_selection_list(
-                cmds.sets(edges_set, query=True))
+            edges_set = get_connection(
+                f"{label_curve}.connection_between_quick_set_and_label_curve")[-1]
+            element_in_set = get_element_in_set(edges_set)
             cmds.setAttr(label_curve +
                          '.connection_between_float_indicator_and_label_curve',
                          len(element_in_set))
-            shape_mesh = cmds.listRelatives(
-                cmds.ls(next(iter(element_in_set))), parent=True, type='mesh')[0]
+            shape_mesh = get_shape_mesh_of_component(next(iter(element_in_set)))
             list_shape_mesh_binded_to_label.add(shape_mesh)
 
-            if not shape_mesh in dict_shape_mesh_and_set:
-                dict_shape_mesh_and_set[shape_mesh] = []
             dict_shape_mesh_and_set[shape_mesh].append(edges_set)
-            if not shape_mesh in dict_shape_mesh_and_label:
-                dict_shape_mesh_and_label[shape_mesh] = []
             dict_shape_mesh_and_label[shape_mesh].append(label_curve)
-            if not shape_mesh in dict_shape_mesh_and_perimeter_curve:
-                dict_shape_mesh_and_perimeter_curve[shape_mesh] = []
             dict_shape_mesh_and_perimeter_curve[shape_mesh].append(
                 perimeter_curve)
         # if the curve is paired than update twin and set colors
-        if (cmds.listConnections(
-                f"{perimeter_curve}.connection_between_perimeter_and_pointer_curve")):
+        if get_connection(
+                f"{perimeter_curve}.connection_between_perimeter_and_pointer_curve"):
 
-            pointer_curve = cmds.listConnections(
-                f"{perimeter_curve}.connection_between_perimeter_and_pointer_curve").pop()
-            twin_closest_curve = cmds.listConnections(
-                f"{pointer_curve}.connection_between_perimeter_and_pointer_curve")
+            pointer_curve = get_connection(
+                f"{perimeter_curve}.connection_between_perimeter_and_pointer_curve")[-1]
+            twin_closest_curve = list(get_connection(
+                f"{pointer_curve}.connection_between_perimeter_and_pointer_curve"))
             twin_closest_curve.remove(perimeter_curve)
             twin_closest_curve = twin_closest_curve.pop()
-            twin_label_curve = (cmds.listConnections(
-                f"{twin_closest_curve}.connection_between_label_and_perimeter_curve").pop())
+            twin_label_curve = get_connection(
+                f"{twin_closest_curve}.connection_between_label_and_perimeter_curve")[-1]
 
             if (label_curve, twin_label_curve) in dict_label_and_twin_label_curve:
                 continue
-            if not cmds.listConnections(
+            if not get_connection(
                     f"{twin_label_curve}.connection_between_quick_set_and_label_curve"):
                 # if the user deletes a mesh that has been binded the set are deleted with the mesh.
                 # the labels are not connected to a set has expected to be.
                 continue
 
-            twin_edges_set = (cmds.listConnections(
-                f"{twin_label_curve}.connection_between_quick_set_and_label_curve").pop())
-            element_in_twin_set = flatten_selection_list(
-                cmds.sets(twin_edges_set, query=True))
+            twin_edges_set = get_connection(
+                f"{twin_label_curve}.connection_between_quick_set_and_label_curve")[-1]
+            element_in_twin_set = get_element_in_set(twin_edges_set)
 
             if len(element_in_set) == len(element_in_twin_set):
                 cmds.setAttr(label_curve + '.overrideColor', 14)
@@ -2013,11 +2108,16 @@ def update_label(list_perimeter_curve: Union[str, Set[str]]) -> None:
 
             set_connected_to_master_mesh = dict_shape_mesh_and_set.get(
                 master_node)
+            perimeter_curve_binded_to_slave_mesh = dict_shape_mesh_and_perimeter_curve.get(
+                shape_mesh)
+            # resolve the perimeter curves once, they are measured again for every set
+            dict_mfn_curve_slave = get_mfn_nurbs_curves(perimeter_curve_binded_to_slave_mesh)
+            # the curve folder is moved after the bind, take the bounding box in world space
+            list_curve_bounding_box_slave = get_curve_world_bounding_box(dict_mfn_curve_slave)
             # print("master",master_node, "slave" ,shape_mesh,"set connected a slave")
             # print(dict_shape_mesh_and_set.get(shape_mesh), "master", set_connected_to_master_mesh)
             for set_master_mesh in set_connected_to_master_mesh:
-                element_in_set = flatten_selection_list(
-                    cmds.sets(set_master_mesh, query=True))
+                element_in_set = get_element_in_set(set_master_mesh)
                 random_edge_in_set = next(iter(element_in_set))
                 list_two_vtx = flatten_selection_list(cmds.polyListComponentConversion(
                     random_edge_in_set, fromEdge=True, toVertex=True))
@@ -2032,33 +2132,14 @@ def update_label(list_perimeter_curve: Union[str, Set[str]]) -> None:
                     random_edge_in_set_slave, fromEdge=True, toVertex=True))
                 list_two_vtx_pos_slave = []
                 for vertex in list_two_vtx_slave:
-                    list_two_vtx_pos_slave.append(cmds.xform(
-                        vertex, worldSpace=1, translation=1, query=1))
-                perimeter_curve_binded_to_slave_mesh = dict_shape_mesh_and_perimeter_curve.get(
-                    shape_mesh)
-
-                dict_vertex_distance = {}
-                for perimeter_curve in perimeter_curve_binded_to_slave_mesh:
-                    selection_list = om2.MSelectionList()
-                    selection_list.add(perimeter_curve)
-                    mfn_curve = om2.MFnNurbsCurve(selection_list.getDagPath(0))
-                    dict_vertex_distance[perimeter_curve] = 0
-                    for vertex_pos in list_two_vtx_pos_slave:
-                        vertex_position = om2.MPoint(vertex_pos)
-                        distance_from_vertex = mfn_curve.distanceToPoint(
-                            vertex_position, space=om2.MSpace.kWorld
-                        )
-                        dict_vertex_distance[perimeter_curve] += distance_from_vertex
+                    list_two_vtx_pos_slave.append(om2.MPoint(cmds.xform(
+                        vertex, worldSpace=1, translation=1, query=1)))
 
-                closest_curve_slave = None
-                closest_distance = float("inf")
-                for perimeter_curve, average_distance in dict_vertex_distance.items():
-                    if average_distance < closest_distance:
-                        closest_curve_slave = perimeter_curve
-                        closest_distance = average_distance
+                closest_curve_slave = get_closest_curve(
+                    list_two_vtx_pos_slave, list_curve_bounding_box_slave)
 
-                label_curve_slave = (cmds.listConnections(
-                    f"{closest_curve_slave}.connection_between_label_and_perimeter_curve").pop())
+                label_curve_slave = get_connection(
+                    f"{closest_curve_slave}.connection_between_label_and_perimeter_curve")[-1]
                 cmds.setAttr(label_curve_slave +
                              '.connection_between_float_indicator_and_label_curve',
                              len(element_in_set))
@@ -2130,17 +2211,18 @@ def bind_label_indicator(
             posed_ref_geometry)
 
     if list_perimeter_curve is None:
-        list_perimeter_curve = set()
-        for curve in return_curve_in_scene()[0]:
-            if cmds.attributeQuery("connection_between_perimeter_and_pointer_curve",
-                                   node=curve, exists=True):
-                if cmds.attributeQuery("connection_between_label_and_perimeter_curve",
-                                       node=curve, exists=True):
-                    list_perimeter_curve.add(curve)
+        list_perimeter_curve = return_perimeter_curve_in_scene()
+
+    # the perimeter curves are the same for every edge loop, attach their function sets once
+    list_curve_bounding_box = get_curve_world_bounding_box(
+        get_mfn_nurbs_curves(list_perimeter_curve))
 
     list_closest_curve = set()
     list_label_curve = set()
+    list_created_label = []  # the new labels get their attributes all together at the end
     for shell in list_input_geometry:
+        # read the world position of every vertex of the shell at once instead of one xform each
+        list_shell_point = get_mfn_mesh(shell).getPoints(om2.MSpace.kWorld)
         if bool_create_label:
             list_input_index_master_uv_point = re_find_uv_master_point(
                 dict_cord_master_uv_point, dict_uv_cord_to_compare_to(shell))
@@ -2159,35 +2241,12 @@ def bind_label_indicator(
                 edge_loop_path, fromEdge=True, toVertex=True)
             list_vertex_loop_path = flatten_selection_list(
                 list_vertex_loop_path)
-            list_curve_pos = []
-            for vertex in list_vertex_loop_path:
-                list_curve_pos.append(cmds.xform(
-                    vertex, worldSpace=1, translation=1, query=1))
-
-            closest_curve = None
-            closest_distance = float("inf")
-            dict_vertex_distance = {}
-            for perimeter_curve in list_perimeter_curve:
-                selection_list = om2.MSelectionList()
-                selection_list.add(perimeter_curve)
-                mfn_curve = om2.MFnNurbsCurve(selection_list.getDagPath(0))
-                dict_vertex_distance[perimeter_curve] = 0
-                for vertex_position in list_curve_pos:
-                    vertex_position = om2.MPoint(vertex_position)
-                    distance_from_vertex = mfn_curve.distanceToPoint(
-                        vertex_position, space=om2.MSpace.kWorld
-                    )
-                    dict_vertex_distance[perimeter_curve] += distance_from_vertex
-
-                dict_vertex_distance[perimeter_curve] /= len(
-                    list_vertex_loop_path)
+            list_curve_pos = [
+                list_shell_point[get_index_component(vertex)]
+                for vertex in list_vertex_loop_path
+            ]
 
-            closest_curve = None
-            closest_distance = float("inf")
-            for perimeter_curve, average_distance in dict_vertex_distance.items():
-                if average_distance < closest_distance:
-                    closest_curve = perimeter_curve
-                    closest_distance = average_distance
+            closest_curve = get_closest_curve(list_curve_pos, list_curve_bounding_box)
             list_closest_curve.add(closest_curve)
 
             if bool_just_return_found_label_curve:
@@ -2219,60 +2278,8 @@ def bind_label_indicator(
                 cmds.sets(edge_loop_path, add=edges_set)
                 element_in_set = flatten_selection_list(
                     cmds.sets(edges_set, query=True))
-                cmds.addAttr(
-                    [label_indicator, label_curve],
-                    longName="connection_between_indicator_and_label_curve",
-                    attributeType="long",
-                    min=0,
-                    max=0,
-                    defaultValue=0,
-                    hidden=True,
-                )
-                cmds.addAttr(
-                    [label_curve, closest_curve],
-                    longName="connection_between_label_and_perimeter_curve",
-                    attributeType="long",
-                    min=0,
-                    max=0,
-                    defaultValue=0,
-                    hidden=True,
-                )
-                cmds.addAttr(
-                    [label_curve, edges_set],
-                    longName="connection_between_quick_set_and_label_curve",
-                    attributeType="long",
-                    min=0,
-                    max=0,
-                    defaultValue=0,
-                    hidden=True,
-                )
-                cmds.addAttr(
-                    label_curve,
-                    longName="connection_between_float_indicator_and_label_curve",
-                    attributeType="long",
-                    hidden=True,
-                )
-                cmds.connectAttr(
-                    f"{label_indicator}.connection_between_indicator_and_label_curve",
-                    f"{label_curve}.connection_between_indicator_and_label_curve",
-                )
-                cmds.connectAttr(
-                    f"{label_curve}.connection_between_label_and_perimeter_curve",
-                    f"{closest_curve}.connection_between_label_and_perimeter_curve",
-                )
-                cmds.connectAttr(
-                    f"{label_curve}.connection_between_quick_set_and_label_curve",
-                    f"{edges_set}.connection_between_quick_set_and_label_curve",
-                )
-                cmds.connectAttr(label_curve +
-                                 '.connection_between_float_indicator_and_label_curve',
-                                 label_indicator + '.uParamValue')
-                cmds.setAttr(label_curve +
-                             '.connection_between_float_indicator_and_label_curve',
-                             len(element_in_set))
-                cmds.setAttr(label_curve + '.overrideEnabled', 1)
-                cmds.setAttr(label_curve + '.overrideColor', 1)
-                cmds.setAttr(f"{label_curve}.visibility", 0)
+                list_created_label.append(
+                    (label_indicator, label_curve, closest_curve, edges_set, len(element_in_set)))
                 list_label_curve.add(label_curve)
 
             else:
@@ -2282,8 +2289,7 @@ def bind_label_indicator(
                 previous_quick_set = cmds.listConnections(
                     f"{label_curve}.connection_between_quick_set_and_label_curve")
                 if previous_quick_set:
-                    deleted_nodes = [node for node in  # pylint: disable=unused-variable
-                                     previous_quick_set if cmds.delete(node)]
+                    cmds.delete(previous_quick_set)
                 edges_set = cmds.sets(
                     name="set_label_0001", empty=True, edges=True)  # edges=1 make them invisible
                 cmds.sets(edge_loop_path, add=edges_set)
@@ -2308,6 +2314,71 @@ def bind_label_indicator(
                              len(element_in_set))
                 list_label_curve.add(label_curve)
 
+    if list_created_label:
+        (
+            list_new_label_indicator,
+            list_new_label_curve,
+            list_new_label_closest_curve,
+            list_new_label_edges_set,
+            _,
+        ) = zip(*list_created_label)
+        cmds.addAttr(
+            list(list_new_label_indicator + list_new_label_curve),
+            longName="connection_between_indicator_and_label_curve",
+            attributeType="long",
+            min=0,
+            max=0,
+            defaultValue=0,
+            hidden=True,
+        )
+        cmds.addAttr(
+            list(list_new_label_curve + list_new_label_closest_curve),
+            longName="connection_between_label_and_perimeter_curve",
+            attributeType="long",
+            min=0,
+            max=0,
+            defaultValue=0,
+            hidden=True,
+        )
+        cmds.addAttr(
+            list(list_new_label_curve + list_new_label_edges_set),
+            longName="connection_between_quick_set_and_label_curve",
+            attributeType="long",
+            min=0,
+            max=0,
+            defaultValue=0,
+            hidden=True,
+        )
+        cmds.addAttr(
+            list(list_new_label_curve),
+            longName="connection_between_float_indicator_and_label_curve",
+            attributeType="long",
+            hidden=True,
+        )
+    for label_indicator, label_curve, closest_curve, edges_set, number_element_in_set in \
+            list_created_label:
+        cmds.connectAttr(
+            f"{label_indicator}.connection_between_indicator_and_label_curve",
+            f"{label_curve}.connection_between_indicator_and_label_curve",
+        )
+        cmds.connectAttr(
+            f"{label_curve}.connection_between_label_and_perimeter_curve",
+            f"{closest_curve}.connection_between_label_and_perimeter_curve",
+        )
+        cmds.connectAttr(
+            f"{label_curve}.connection_between_quick_set_and_label_curve",
+            f"{edges_set}.connection_between_quick_set_and_label_curve",
+        )
+        cmds.connectAttr(label_curve +
+                         '.connection_between_float_indicator_and_label_curve',
+                         label_indicator + '.uParamValue')
+        cmds.setAttr(label_curve +
+                     '.connection_between_float_indicator_and_label_curve',
+                     number_element_in_set)
+        cmds.setAttr(label_curve + '.overrideEnabled', 1)
+        cmds.setAttr(label_curve + '.overrideColor', 1)
+        cmds.setAttr(f"{label_curve}.visibility", 0)
+
     if not bool_just_return_found_label_curve:
         update_label(list_closest_curve)
 
@@ -2343,8 +2414,12 @@ def analyze_and_unwrap(
     raise_error_if_mesh_has_unpairable_uv_border(geometry_name)
 
     # get all the require information about the components of the mesh
+    mfn_mesh = get_mfn_mesh(geometry_name)
+    # read the topology once, the border helpers below share it
+    list_face = get_face_vertices_and_uvs(mfn_mesh)
+    list_edge = get_edge_vertices_and_faces(mfn_mesh, list_face)
     list_component_on_uv_border = get_component_on_border(
-        geometry_name, mode="UV")
+        mfn_mesh, mode="UV", list_face=list_face, list_edge=list_edge)
     (
         list_vertex_on_uv_border_index,
         list_edge_on_uv_border_index,
@@ -2357,12 +2432,14 @@ def analyze_and_unwrap(
         list_component_on_uv_border[0],
     )
     list_vertex_index_on_border = get_component_on_border(
-        geometry_name, mode="vtx")
+        mfn_mesh, mode="vtx", list_edge=list_edge)
     dict_neighbor_uv_on_border = get_neighbors_uv_on_border(
         geometry_name,
         list_edge_on_uv_border_index,
         list_face_on_uv_border_index,
         list_uv_on_border_index,
+        list_face=list_face,
+        list_edge=list_edge,
     )
 
     # find the all the UV master point of the "posed_geometry_name" and store their coordinate
@@ -2389,11 +2466,6 @@ def analyze_and_unwrap(
         shell_group_folder, name=f"{geometry_name.split('|')[-1]}_shell_01",
         constructionHistory=False)  # polySeparate create a folder
 
-    #
-    list_input_index_master_uv_point = re_find_uv_master_point(
-        dict_cord_master_uv_point, dict_uv_cord_to_compare_to(unwrapped_geo)
-    )
-
     # for each flatten shell calculate the list of curve using the Master UV point
     dummy_attr_perimeter_pointer_curve = (
         "connection_between_unwrapped_geo_and_separated_shells"
@@ -2419,8 +2491,7 @@ def analyze_and_unwrap(
             list_input_index_master_uv_point,
             just_return_list_edge_loop_full_name=False
         )
-        list_all_created_curve = list_all_created_curve.union(
-            list_created_curve)
+        list_all_created_curve.update(list_created_curve)
         cmds.connectAttr(
             f"{unwrapped_geo}.{dummy_attr_perimeter_pointer_curve}",
             f"{shell}.{dummy_attr_perimeter_pointer_curve}",
@@ -2508,20 +2579,27 @@ def calculate_faces_per_material(geometry_name: str) -> Dict[str, Set[str]]:
         return None
 
     dict_faces_per_material = {}
+    # a whole object can be listed by more than one shading engine, expand its faces only once
+    dict_all_faces_per_object = {}
     for shading_engine in set(list_shading_engines):
         every_surface_where_assigned = cmds.sets(shading_engine, q=True)
         if every_surface_where_assigned is None:
             continue
         list_face_filtered = set()
+        list_component_on_geometry = []
         for component in every_surface_where_assigned:
             split_component_part = component.split(".")
             if len(split_component_part) == 1:
-                list_face_filtered.update(
-                    cmds.ls(f"{component}.f[*]", flatten=True))
+                if component not in dict_all_faces_per_object:
+                    dict_all_faces_per_object[component] = cmds.ls(
+                        f"{component}.f[*]", flatten=True)
+                list_face_filtered.update(dict_all_faces_per_object[component])
             else:
                 if split_component_part[0] == geometry_name:
-                    list_face_filtered.update(
-                        flatten_selection_list(component))
+                    list_component_on_geometry.append(component)
+        if list_component_on_geometry:
+            list_face_filtered.update(
+                flatten_selection_list(list_component_on_geometry))
 
         dict_faces_per_material[shading_engine] = list_face_filtered
 
@@ -2542,31 +2620,44 @@ def are_two_meshes_identical(
     Returns:
         bool: Returns true if the geometry are identical. Otherwise returns false.
     """
-    if isinstance(geometry_00, str):
-        selection_list = om2.MSelectionList()
-        selection_list.add(geometry_00)
-        mfn_mesh_00 = om2.MFnMesh(selection_list.getDagPath(0))
-        list_cord_vtx_mesh_00 = mfn_mesh_00.getPoints()
+    threshold = 0.000001
+
+    # two geometries given by name can be told apart by their vertex count and bounding box,
+    # both are cheap to read compared to all the vertex positions
+    if isinstance(geometry_00, str) and isinstance(geometry_01, str):
+        mfn_mesh_00 = get_mfn_mesh(geometry_00)
+        mfn_mesh_01 = get_mfn_mesh(geometry_01)
+        if mfn_mesh_00.numVertices != mfn_mesh_01.numVertices:
+            return False
+        bounding_box_00 = mfn_mesh_00.boundingBox
+        bounding_box_01 = mfn_mesh_01.boundingBox
+        for corner_00, corner_01 in ((bounding_box_00.min, bounding_box_01.min),
+                                     (bounding_box_00.max, bounding_box_01.max)):
+            if any(abs(corner_00[axis] - corner_01[axis]) > threshold for axis in range(3)):
+                return False
+        geometry_00 = mfn_mesh_00
+        geometry_01 = mfn_mesh_01
+
+    if isinstance(geometry_00, (str, om2.MFnMesh)):
+        list_cord_vtx_mesh_00 = get_mfn_mesh(geometry_00).getPoints()
     else:
         list_cord_vtx_mesh_00 = geometry_00
 
-    if isinstance(geometry_01, str):
-        selection_list = om2.MSelectionList()
-        selection_list.add(geometry_01)
-        mfn_mesh_01 = om2.MFnMesh(selection_list.getDagPath(0))
-        list_cord_vtx_mesh_01 = mfn_mesh_01.getPoints()
+    if isinstance(geometry_01, (str, om2.MFnMesh)):
+        list_cord_vtx_mesh_01 = get_mfn_mesh(geometry_01).getPoints()
     else:
         list_cord_vtx_mesh_01 = geometry_01
 
-    threshold = 0.000001
-
     if len(list_cord_vtx_mesh_00) != len(list_cord_vtx_mesh_01):
         return False
 
-    for (cord_point_00, cord_point_01) in zip(list_cord_vtx_mesh_00, list_cord_vtx_mesh_01):
-        if not cord_point_00.isEquivalent(cord_point_01, threshold):
-            return False
-    return True
+    # let the C implementation of isEquivalent run over the arrays, it stops at the first mismatch
+    return all(map(
+        om2.MPoint.isEquivalent,
+        list_cord_vtx_mesh_00,
+        list_cord_vtx_mesh_01,
+        itertools.repeat(threshold),
+    ))
 
 
 def create_material(
@@ -2603,79 +2694,36 @@ def ordered_vertex_loop_from_edge_loop(
     Returns:
         List[str]: all the vertexes that make the input edge loop path listed in topological order. 
     """
-    # TODO: rewrite this
     shape_node = cmds.listRelatives(
         edge_loop_path[0], path=True, parent=True)
     transform_node = cmds.listRelatives(
         shape_node[0], path=True, parent=True)
-    edge_number_list = []
-    for edge in edge_loop_path:
-        check_number = ((edge.split('.')[1]).split('\n')[0]).split(' ')
-        for check in check_number:
-            find_number = ''.join(
-                [n for n in check.split('|')[-1] if n.isdigit()])
-            if find_number:
-                edge_number_list.append(find_number)
-    get_number = []
+    mfn_mesh = get_mfn_mesh(shape_node[0])
+
+    # read the two vertices of every edge once and link them to each other
+    dict_vertex_neighbor = collections.defaultdict(list)
     for edge in edge_loop_path:
-        vtx_list = cmds.polyInfo(edge, edgeToVertex=True)
-        check_number = ((vtx_list[0].split(':')[1]).split('\n')[0]).split(' ')
-        for check in check_number:
-            find_number = ''.join(
-                [n for n in check.split('|')[-1] if n.isdigit()])
-            if find_number:
-                get_number.append(find_number)
-    dup = set([x for x in get_number if get_number.count(x) > 1])
-    get_head_tail = list(set(get_number) - dup)
-    check_circle_state = 0
-    if not get_head_tail:  # close curve
-        check_circle_state = 1
-        get_head_tail.append(get_number[0])
-    vft_order = []
-    vft_order.append(get_head_tail[0])
-    count = 0
-    while len(dup) > 0 and count < 1000:
-        check_vtx = transform_node[0]+'.vtx[' + vft_order[-1] + ']'
-        vtx_list = cmds.polyInfo(check_vtx, ve=True)
-        get_number = []
-        check_number = ((vtx_list[0].split(':')[1]).split('\n')[0]).split(' ')
-        for check in check_number:
-            find_number = ''.join(
-                [n for n in check.split('|')[-1] if n.isdigit()])
-            if find_number:
-                get_number.append(find_number)
-        find_next_edge = []
-        for get in get_number:
-            if get in edge_number_list:
-                find_next_edge = get
-        edge_number_list.remove(find_next_edge)
-        check_vtx = transform_node[0]+'.e[' + find_next_edge + ']'
-        find_vtx = cmds.polyInfo(check_vtx, ev=True)
-        get_number = []
-        check_number = ((find_vtx[0].split(':')[1]).split('\n')[0]).split(' ')
-        for check in check_number:
-            find_number = ''.join(
-                [n for n in check.split('|')[-1] if n.isdigit()])
-            if find_number:
-                get_number.append(find_number)
-        got_next_vtx = []
-        for get in get_number:
-            if get in dup:
-                got_next_vtx = get
-        dup.remove(got_next_vtx)
-        vft_order.append(got_next_vtx)
-        count += 1
-    if check_circle_state == 0:
-        vft_order.append(get_head_tail[1])
-    else:  # close curve remove connected vtx
-        if vft_order[0] == vft_order[1]:
-            vft_order = vft_order[1:]
-        elif vft_order[0] == vft_order[-1]:
-            vft_order = vft_order[0:-1]
-    final_list = []
-    for vertex in vft_order:
-        final_list.append(transform_node[0]+'.vtx[' + vertex + ']')
-    return final_list
+        vtx_00, vtx_01 = mfn_mesh.getEdgeVertices(get_index_component(edge))
+        dict_vertex_neighbor[vtx_00].append(vtx_01)
+        dict_vertex_neighbor[vtx_01].append(vtx_00)
+
+    # an open loop starts from one of its two ends, a closed loop has none so start anywhere
+    list_end_vertex = [vertex for vertex, list_neighbor in dict_vertex_neighbor.items()
+                       if len(list_neighbor) == 1]
+    start_vertex = list_end_vertex[0] if list_end_vertex else next(iter(dict_vertex_neighbor))
+
+    list_ordered_vertex = [start_vertex]
+    previous_vertex = None
+    current_vertex = start_vertex
+    while len(list_ordered_vertex) < len(dict_vertex_neighbor):
+        list_next_vertex = [vertex for vertex in dict_vertex_neighbor[current_vertex]
+                            if vertex != previous_vertex]
+        if not list_next_vertex or list_next_vertex[0] == start_vertex:
+            break
+        previous_vertex, current_vertex = current_vertex, list_next_vertex[0]
+        list_ordered_vertex.append(current_vertex)
+
+    return [f"{transform_node[0]}.vtx[{vertex}]" for vertex in list_ordered_vertex]
 
 
 def get_smart_mirror_twin(geometry_name: str) -> Optional[Union[str, Set[str]]]:
@@ -2796,9 +2844,14 @@ def run_relax_sculpt_mode(
                 dict_points_position_before_relax[mesh] = mfn_mesh.getPoints()
         else:
             stop_relax = True
-        for i in range(0, 100):  # pylint: disable=unused-variable
-            cmds.sculptMeshCacheCtx(
-                "sculptMeshCacheContext", edit=True, flood=100)
+        # the viewport does not need to redraw between two floods, only after the last one
+        cmds.refresh(suspend=True)
+        try:
+            for _ in range(100):
+                cmds.sculptMeshCacheCtx(
+                    "sculptMeshCacheContext", edit=True, flood=100)
+        finally:
+            cmds.refresh(suspend=False)
 
         if relax_till_done:
             dict_points_position_after_relax = {}
@@ -2809,10 +2862,7 @@ def run_relax_sculpt_mode(
                     mesh)
                 point_after_relax = dict_points_position_after_relax.get(mesh)
                 # Check if the two point arrays are equal
-                for (point_before, point_after) in zip(point_before_relax, point_after_relax):
-                    if not point_before.isEquivalent(point_after, 0.000001):
-                        break
-                else:
+                if are_two_meshes_identical(point_before_relax, point_after_relax):
                     stop_relax = True
                     cmds.progressBar(main_progress_bar,
                                      edit=True, endProgress=True)
@@ -2852,26 +2902,26 @@ def relax_flat_mesh(
     else:
         list_geo_to_relax = set(list_geo_to_relax)
 
+    def is_mesh_plug_connected(mesh: str, plug_name: str) -> bool:
+        # same answer as cmds.listConnections(f"{mesh}.{plug_name}") but read on the live plug
+        # of the shape, without going through a command.
+        return get_mfn_mesh(mesh).findPlug(plug_name, False).isConnected
+
     dict_patent_and_child_smart_mirror = {}
     for geo_to_relax in list_geo_to_relax.copy():
-        if cmds.listConnections(f'{geo_to_relax}.outMesh'):
+        if is_mesh_plug_connected(geo_to_relax, "outMesh"):
             list_slave_mirror_node = get_smart_mirror_twin(geo_to_relax)
             dict_patent_and_child_smart_mirror[geo_to_relax] = list_slave_mirror_node
             # if mesh is parent smart mirror than relax also the children
-            if isinstance(list_slave_mirror_node, set):
-                for slave in list_slave_mirror_node:
-                    name_slave_mesh = cmds.listRelatives(
-                        slave,
-                        parent=True,
-                        type='transform')[0]
-                    list_geo_to_relax.add(name_slave_mesh)
             if isinstance(list_slave_mirror_node, str):
-                name_slave_mesh = cmds.listRelatives(
-                    list_slave_mirror_node,
+                list_slave_mirror_node = {list_slave_mirror_node}
+            if list_slave_mirror_node:
+                # one query for the transforms of all the children
+                list_geo_to_relax.update(cmds.listRelatives(
+                    list(list_slave_mirror_node),
                     parent=True,
-                    type='transform')[0]
-                list_geo_to_relax.add(name_slave_mesh)
-        if cmds.listConnections(f'{geo_to_relax}.inMesh'):
+                    type='transform') or [])
+        if is_mesh_plug_connected(geo_to_relax, "inMesh"):
             parent_mesh = get_smart_mirror_twin(geo_to_relax)
             if not parent_mesh in dict_patent_and_child_smart_mirror:
                 dict_patent_and_child_smart_mirror[parent_mesh] = set()
@@ -2896,16 +2946,12 @@ def relax_flat_mesh(
     dict_cord_master_uv_point = dict_cord_master_uv_points_from_posed_mesh(
         posed_ref_geometry)
 
-    list_perimeter_curve = set()
-    for curve in return_curve_in_scene()[0]:
-        if cmds.attributeQuery("connection_between_perimeter_and_pointer_curve",
-                               node=curve, exists=True):
-            if cmds.attributeQuery("connection_between_label_and_perimeter_curve",
-                                   node=curve, exists=True):
-                list_perimeter_curve.add(curve)
+    list_perimeter_curve = return_perimeter_curve_in_scene()
 
     for curve in list_perimeter_curve:
         cmds.move(0, 0, -0.001, curve, absolute=True)  # better for hitest()
+    dict_mfn_perimeter_curve = get_mfn_nurbs_curves(list_perimeter_curve)
+    list_curve_bounding_box = get_curve_world_bounding_box(dict_mfn_perimeter_curve)
     list_mesh_to_relax_precisely = set()  # to relax until they are perfectly spaced
     for geo_to_relax in list_geo_to_relax:
 
@@ -2916,73 +2962,48 @@ def relax_flat_mesh(
             list_input_index_master_uv_point,
             just_return_list_edge_loop_full_name=True
         )
+        # read the vertex positions once, the array follows every vertex moved below
+        list_geo_point = get_mfn_mesh(geo_to_relax).getPoints(om2.MSpace.kWorld)
 
         for edge_loop_path in list_edge_loop_path:
             ordered_vertex_loop_path = ordered_vertex_loop_from_edge_loop(
                 list(edge_loop_path))
 
-            list_curve_pos = []
-            for vertex in ordered_vertex_loop_path:
-                list_curve_pos.append(cmds.xform(
-                    vertex, worldSpace=1, translation=1, query=1))
-
-            closest_curve = None
-            closest_distance = float("inf")
-            dict_vertex_distance = {}
-            for perimeter_curve in list_perimeter_curve:
-                selection_list = om2.MSelectionList()
-                selection_list.add(perimeter_curve)
-                mfn_curve = om2.MFnNurbsCurve(selection_list.getDagPath(0))
-                dict_vertex_distance[perimeter_curve] = 0
-                for vertex_position in list_curve_pos:
-                    vertex_position = om2.MPoint(vertex_position)
-                    distance_from_vertex = mfn_curve.distanceToPoint(
-                        vertex_position, space=om2.MSpace.kWorld)
-                    dict_vertex_distance[perimeter_curve] += distance_from_vertex
-                dict_vertex_distance[perimeter_curve] /= len(
-                    ordered_vertex_loop_path)
-
-            closest_curve = None
-            closest_distance = float("inf")
-            for perimeter_curve, average_distance in dict_vertex_distance.items():
-                if average_distance < closest_distance:
-                    closest_curve = perimeter_curve
-                    closest_distance = average_distance
+            list_vertex_index = [get_index_component(vertex)
+                                 for vertex in ordered_vertex_loop_path]
+            list_curve_pos = [list_geo_point[vertex_index] for vertex_index in list_vertex_index]
+
+            closest_curve = get_closest_curve(list_curve_pos, list_curve_bounding_box)
+            mfn_closest_curve = dict_mfn_perimeter_curve[closest_curve]
             # Check if reversing the curve is needed.
             # It the vertex would travel less in 3D space the curve is reversed.
-            distance_first_direction = 0
-            distance_other_direction = 0
-            counter_reversed = list(range(len(ordered_vertex_loop_path)))[::-1]
-            if cmds.getAttr(f"{closest_curve}.form") == 0:
+            if mfn_closest_curve.form == om2.MFnNurbsCurve.kOpen:
                 len_ratio = len(list_curve_pos)-1
             else:
                 len_ratio = len(list_curve_pos)
                 list_mesh_to_relax_precisely.add(geo_to_relax)
-            for counter, vertex in enumerate(ordered_vertex_loop_path):
-                ratio_pos = float(counter)/float(len_ratio)
-                pos_cv = cmds.pointOnCurve(
-                    closest_curve, top=True, pr=ratio_pos)
-                ratio_pos_reversed = float(
-                    counter_reversed[counter])/float(len_ratio)
-                pos_cv_reversed = cmds.pointOnCurve(
-                    closest_curve, top=True, pr=ratio_pos_reversed)
-                cord_vertex_to_move = cmds.xform(
-                    vertex, worldSpace=True, translation=True, q=True)
-                distance_first_direction += math.dist(
-                    cord_vertex_to_move, pos_cv)
-                distance_other_direction += math.dist(
-                    cord_vertex_to_move, pos_cv_reversed)
-            for counter, vertex in enumerate(ordered_vertex_loop_path):
-                if distance_first_direction < distance_other_direction:
-                    ratio_pos = float(counter)/float(len_ratio)
-                    pos_cv = cmds.pointOnCurve(
-                        closest_curve, top=True, pr=ratio_pos)
-                else:
-                    ratio_pos_reversed = float(
-                        counter_reversed[counter])/float(len_ratio)
-                    pos_cv = cmds.pointOnCurve(
-                        closest_curve, top=True, pr=ratio_pos_reversed)
+            # same as cmds.pointOnCurve(turnOnPercentage=True), the ratio spans the knot domain.
+            # The reversed ratios are the same ones backwards, evaluate the curve only once.
+            start_param, end_param = mfn_closest_curve.knotDomain
+            list_pos_cv = [
+                mfn_closest_curve.getPointAtParam(
+                    start_param + (end_param - start_param) * float(counter) / float(len_ratio),
+                    om2.MSpace.kWorld)
+                for counter in range(len(ordered_vertex_loop_path))
+            ]
+            list_pos_cv_reversed = list_pos_cv[::-1]
+            distance_first_direction = sum(
+                cord_vertex_to_move.distanceTo(pos_cv)
+                for cord_vertex_to_move, pos_cv in zip(list_curve_pos, list_pos_cv))
+            distance_other_direction = sum(
+                cord_vertex_to_move.distanceTo(pos_cv)
+                for cord_vertex_to_move, pos_cv in zip(list_curve_pos, list_pos_cv_reversed))
+            if distance_first_direction >= distance_other_direction:
+                list_pos_cv = list_pos_cv_reversed
+            for vertex, vertex_index, pos_cv in zip(
+                    ordered_vertex_loop_path, list_vertex_index, list_pos_cv):
                 cmds.move(pos_cv[0], pos_cv[1], pos_cv[2], vertex, a=True)
+                list_geo_point[vertex_index] = pos_cv
     if list_mesh_to_relax_precisely:
         # workaround for mesh that have a closed curve
         run_relax_sculpt_mode(
@@ -3162,18 +3183,29 @@ def create_and_place_mirror(
             conformToSmoothMeshPreview=1,
             constructionHistory=False,
         )[0]
-        cmds.setAttr(f"{slave_mesh}.scaleX",
-                     cmds.getAttr(f"{slave_mesh}.scaleX") * -1)
-        cmds.select(edge_border_goal_mesh)
-        dummy_curve_perimeter_goal_mesh_flipped = cmds.polyToCurve(
-            form=1,  # form=1 (always open)
-            degree=1,
-            name="dummy_curve_perimeter_goal_mesh_flipped",
-            conformToSmoothMeshPreview=1,
-            constructionHistory=False,
-        )[0]
-        cmds.setAttr(f"{slave_mesh}.scaleX",
-                     cmds.getAttr(f"{slave_mesh}.scaleX")*-1)
+        # negating the scaleX of the slave mesh mirrors it along its local X axis, about its
+        # scale pivot. Apply the same mirror to a copy of the curve instead of flipping the mesh
+        # and running polyToCurve a second time.
+        matrix_slave_mesh = om2.MMatrix(
+            cmds.xform(slave_mesh, query=True, matrix=True, worldSpace=True))
+        scale_pivot_slave_mesh = cmds.xform(
+            slave_mesh, query=True, scalePivot=True, objectSpace=True)
+        matrix_mirror_x = om2.MMatrix((
+            (-1, 0, 0, 0),
+            (0, 1, 0, 0),
+            (0, 0, 1, 0),
+            (2 * scale_pivot_slave_mesh[0], 0, 0, 1),
+        ))
+        matrix_curve_unflipped = om2.MMatrix(cmds.xform(
+            dummy_curve_perimeter_goal_mesh_unflipped, query=True, matrix=True, worldSpace=True))
+        matrix_curve_flipped = (matrix_curve_unflipped * matrix_slave_mesh.inverse() *
+                                matrix_mirror_x * matrix_slave_mesh)
+        dummy_curve_perimeter_goal_mesh_flipped = cmds.duplicate(
+            dummy_curve_perimeter_goal_mesh_unflipped,
+            name="dummy_curve_perimeter_goal_mesh_flipped")[0]
+        cmds.xform(dummy_curve_perimeter_goal_mesh_flipped, worldSpace=True,
+                   matrix=[matrix_curve_flipped.getElement(row, column)
+                           for row in range(4) for column in range(4)])
 
         selection_list = om2.MSelectionList()
         selection_list.add(dummy_curve_perimeter_goal_mesh_unflipped)
@@ -3185,15 +3217,18 @@ def create_and_place_mirror(
         selection_list.add(mesh_smart_mirror)
         mfn_smart_mirror = om2.MFnMesh(selection_list.getDagPath(2))
 
-        distance_start_mesh_unflipped = 0
-        distance_start_mesh_flipped = 0
-        for vertex in get_component_on_border(master_mesh, mode="vtx"):
-            pos_vtx_point_smart_mirror = mfn_smart_mirror.getPoint(
-                vertex, space=om2.MSpace.kWorld)
-            distance_start_mesh_unflipped += mfn_curve_unflipped.distanceToPoint(
-                pos_vtx_point_smart_mirror, space=om2.MSpace.kWorld)
-            distance_start_mesh_flipped += mfn_curve_flipped.distanceToPoint(
-                pos_vtx_point_smart_mirror, space=om2.MSpace.kWorld)
+        # read the positions of the whole mirror at once and keep the border ones
+        list_point_smart_mirror = mfn_smart_mirror.getPoints(om2.MSpace.kWorld)
+        list_border_point_smart_mirror = [
+            list_point_smart_mirror[vertex]
+            for vertex in get_component_on_border(master_mesh, mode="vtx")
+        ]
+        distance_start_mesh_unflipped = sum(
+            mfn_curve_unflipped.distanceToPoint(pos_vtx_point_smart_mirror, space=om2.MSpace.kWorld)
+            for pos_vtx_point_smart_mirror in list_border_point_smart_mirror)
+        distance_start_mesh_flipped = sum(
+            mfn_curve_flipped.distanceToPoint(pos_vtx_point_smart_mirror, space=om2.MSpace.kWorld)
+            for pos_vtx_point_smart_mirror in list_border_point_smart_mirror)
 
         cmds.delete((dummy_curve_perimeter_goal_mesh_unflipped,
                     dummy_curve_perimeter_goal_mesh_flipped))
@@ -3250,18 +3285,20 @@ def reconstruct_mesh(
     def percentage_difference(value_01: Union[int, float], value_02: Union[int, float]):
         return abs(value_01 - value_02) / ((value_01 + value_02) / 2) * 100
 
-    area_flatten_ref = cmds.polyEvaluate(
-        flatten_ref_geometry, worldArea=True)
+    # with more than one flag polyEvaluate returns a dict keyed by the flag names
+    dict_area_flatten_ref = cmds.polyEvaluate(
+        flatten_ref_geometry, worldArea=True, uvArea=True)
+    area_flatten_ref = dict_area_flatten_ref["worldArea"]
 
     if len(list_geo_to_reconstruct) != cmds.polyEvaluate(posed_ref_geometry, uvShell=True):
         message("the number of UV shell do not match up", raise_error=True)
-    area_uv_flatten_ref = cmds.polyEvaluate(
-        flatten_ref_geometry, uvArea=True)
+    area_uv_flatten_ref = dict_area_flatten_ref["uvArea"]
     area_selected_mesh = float()
     area_uv_selected_mesh = float()
     for mesh in list_geo_to_reconstruct:
-        area_selected_mesh += cmds.polyEvaluate(mesh, worldArea=True)
-        area_uv_selected_mesh += cmds.polyEvaluate(mesh, uvArea=True)
+        dict_area_mesh = cmds.polyEvaluate(mesh, worldArea=True, uvArea=True)
+        area_selected_mesh += dict_area_mesh["worldArea"]
+        area_uv_selected_mesh += dict_area_mesh["uvArea"]
 
     area_diff = percentage_difference(area_flatten_ref, area_selected_mesh)
     if area_diff > 0.1:
@@ -3336,35 +3373,33 @@ def reconstruct_mesh(
                           s=len(ordered_vertex_loop_path)-1, d=1, tol=0)
         dict_curve_and_list_vertex_loop[output_curve] = ordered_vertex_loop_path
 
+    # read the vertex positions once, the array follows every vertex moved below
+    list_mesh_point = get_mfn_mesh(mesh_merged).getPoints(om2.MSpace.kWorld)
     for output_curve, ordered_vertex_loop_path in dict_curve_and_list_vertex_loop.items():
         # Check if reversing the curve is needed.
         # It the vertex would travel less in 3D space the curve is reversed.
-        distance_first_direction = float()
-        distance_other_direction = float()
-        counter_reversed = list(
-            range(len(ordered_vertex_loop_path)))[::-1]
-        for counter, vertex in enumerate(ordered_vertex_loop_path):
-            pos_cv = cmds.xform(
-                f"{output_curve}.ep[{counter}]", worldSpace=True, translation=True, q=True)
-            pos_cv_reversed = cmds.xform(
-                f"{output_curve}.ep[{counter_reversed[counter]}]", worldSpace=True,
-                translation=True, q=True)
-            cord_vertex_to_move = cmds.xform(
-                vertex, worldSpace=True, translation=True, q=True)
-            distance_first_direction += math.dist(
-                cord_vertex_to_move, pos_cv)
-            distance_other_direction += math.dist(
-                cord_vertex_to_move, pos_cv_reversed)
-        for counter, vertex in enumerate(ordered_vertex_loop_path):
-            if distance_first_direction < distance_other_direction:
-                pos_cv = cmds.xform(
-                    f"{output_curve}.ep[{counter}]",
-                    worldSpace=True, translation=True, q=True)
-            else:
-                pos_cv = cmds.xform(
-                    f"{output_curve}.ep[{counter_reversed[counter]}]",
-                    worldSpace=True, translation=True, q=True)
+        # read all the edit points in one query, the reversed direction is the same list backwards
+        flat_list_pos_cv = cmds.xform(
+            f"{output_curve}.ep[0:{len(ordered_vertex_loop_path) - 1}]",
+            worldSpace=True, translation=True, q=True)
+        list_pos_cv = [om2.MPoint(flat_list_pos_cv[index:index + 3])
+                       for index in range(0, len(flat_list_pos_cv), 3)]
+        list_pos_cv_reversed = list_pos_cv[::-1]
+        list_vertex_index = [get_index_component(vertex) for vertex in ordered_vertex_loop_path]
+        list_cord_vertex_to_move = [list_mesh_point[vertex_index]
+                                    for vertex_index in list_vertex_index]
+        distance_first_direction = sum(
+            cord_vertex_to_move.distanceTo(pos_cv)
+            for cord_vertex_to_move, pos_cv in zip(list_cord_vertex_to_move, list_pos_cv))
+        distance_other_direction = sum(
+            cord_vertex_to_move.distanceTo(pos_cv)
+            for cord_vertex_to_move, pos_cv in zip(list_cord_vertex_to_move, list_pos_cv_reversed))
+        if distance_first_direction >= distance_other_direction:
+            list_pos_cv = list_pos_cv_reversed
+        for vertex, vertex_index, pos_cv in zip(
+                ordered_vertex_loop_path, list_vertex_index, list_pos_cv):
             cmds.move(pos_cv[0], pos_cv[1], pos_cv[2], vertex, a=True)
+            list_mesh_point[vertex_index] = pos_cv
         cmds.delete(output_curve)
 
     cmds.polySetToFaceNormal(mesh_merged)
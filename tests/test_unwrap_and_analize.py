@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 import maya.cmds as cmds
 from ZR4M.ZR4M import analyze_and_unwrap as ZR4M_analyze_and_unwrap
+from ZR4M.ZR4M import get_component_on_border as ZR4M_get_component_on_border
 
 def test_analyze_and_unwrap():
     """Check if analyze_and_unwrap() is working with some basic shapes"""
@@ -35,6 +36,18 @@ def test_analyze_and_unwrap():
 
     cmds.inViewMessage(message="Test passed", pos="midCenter",fade=True)
 
+def test_get_component_on_border_without_uvs():
+    """Check that the topology modes of get_component_on_border() work on unmapped faces"""
+
+    input_geo = cmds.polyPlane(sx=2, sy=2, ch=0)[0]
+    cmds.polyMapDel(f"{input_geo}.f[0]", ch=0)  # some faces without UVs
+    for _ in range(2):
+        assert len(ZR4M_get_component_on_border(input_geo, "edge")) == 8, "8 edges on border"
+        assert len(ZR4M_get_component_on_border(input_geo, "vtx")) == 8, "8 vertexes on border"
+        assert len(ZR4M_get_component_on_border(input_geo, "face")) == 4, "4 faces on border"
+        cmds.polyMapDel(f"{input_geo}.map[*]", ch=0)  # then no UVs at all
+    cmds.file(force=True, new=True)
+
 def test_speed_analyze_and_unwrap(output_path: Optional[Path]):
     """Diagnose code by running analyze_and_unwrap() on a dense cube
 
@@ -65,4 +78,5 @@ if __name__ == "__main__":
         tmp_dir.mkdir(parents=True)
 
     test_analyze_and_unwrap()
+    test_get_component_on_border_without_uvs()
     test_speed_analyze_and_unwrap(tmp_dir / "profiling.prof") # use snakeviz or similar